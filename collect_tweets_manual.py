@@ -8,6 +8,7 @@ import os
 import sys
 import django
 import time
+import re
 import csv
 from datetime import datetime
 from selenium import webdriver
@@ -26,6 +27,10 @@ os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'pressiona.settings')
 django.setup()
 
 from pressionaapp.models import Deputado, Senador
+from pressionaapp.twitter_utils import TWITTER_URL_RE
+
+# Engagement counts in a metric button's aria-label, e.g. "1234 Likes. Like"
+METRIC_COUNT_RE = re.compile(r'\d+')
 
 class TwitterProfileTweetCollector:
     def __init__(self):
@@ -154,19 +159,9 @@ class TwitterProfileTweetCollector:
         if not twitter_url:
             return None
         
-        # Remove protocol and domain
-        username = twitter_url.replace('https://', '').replace('http://', '')
-        username = username.replace('x.com/', '').replace('twitter.com/', '')
-        
-        # Remove any path after username
-        if '/' in username:
-            username = username.split('/')[0]
-        
-        # Remove query parameters
-        if '?' in username:
-            username = username.split('?')[0]
-        
-        return username.strip()
+        # Protocol, www, @, path and query string are all skipped by the pattern
+        match = TWITTER_URL_RE.search(twitter_url)
+        return match.group(1) if match else twitter_url.strip()
     
     def visit_profile_and_get_latest_tweet(self, politician):
         """Visit politician's profile and get their latest tweet"""
@@ -285,18 +280,17 @@ class TwitterProfileTweetCollector:
                     
                     if 'like' in aria_label.lower():
                         # Extract number from aria-label
-                        import re
-                        numbers = re.findall(r'\\d+', aria_label.replace(',', ''))
+                        numbers = METRIC_COUNT_RE.findall(aria_label.replace(',', ''))
                         if numbers:
                             tweet_data['likes'] = int(numbers[0])
                     
                     elif 'repost' in aria_label.lower() or 'retweet' in aria_label.lower():
-                        numbers = re.findall(r'\\d+', aria_label.replace(',', ''))
+                        numbers = METRIC_COUNT_RE.findall(aria_label.replace(',', ''))
                         if numbers:
                             tweet_data['retweets'] = int(numbers[0])
                     
                     elif 'repl' in aria_label.lower():
-                        numbers = re.findall(r'\\d+', aria_label.replace(',', ''))
+                        numbers = METRIC_COUNT_RE.findall(aria_label.replace(',', ''))
                         if numbers:
                             tweet_data['replies'] = int(numbers[0])
             except:
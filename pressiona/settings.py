@@ -95,6 +95,60 @@ DATABASES = {
 }
 
 
+# Cache
+# https://docs.djangoproject.com/en/5.2/topics/cache/
+
+CACHES = {
+    'default': {
+        'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+    },
+    # On-disk HTTP responses shared by the extraction commands between runs.
+    # One full run stores roughly 2,000 entries (513 deputy details and pages, ~81 senators'
+    # responses, list pages and Grok answers); the default MAX_ENTRIES of 300 would cull
+    # most of them at random, so the limit leaves several runs' worth of headroom
+    'http': {
+        'BACKEND': 'django.core.cache.backends.filebased.FileBasedCache',
+        'LOCATION': BASE_DIR / '.http_cache',
+        'TIMEOUT': 60 * 60 * 24 * 7,
+        'OPTIONS': {
+            'MAX_ENTRIES': 10000,
+        },
+    },
+    # Admin filter choices; on disk so the extraction commands can invalidate what the web process serves
+    'admin': {
+        'BACKEND': 'django.core.cache.backends.filebased.FileBasedCache',
+        'LOCATION': BASE_DIR / '.admin_cache',
+    },
+}
+
+
+# Logging
+# https://docs.djangoproject.com/en/5.2/topics/logging/
+
+LOGGING = {
+    'version': 1,
+    'disable_existing_loggers': False,
+    'formatters': {
+        'simple': {
+            'format': '%(levelname)s:%(name)s:%(message)s',
+        },
+    },
+    'handlers': {
+        'console': {
+            'class': 'logging.StreamHandler',
+            'formatter': 'simple',
+        },
+    },
+    'loggers': {
+        # Progress output of the extraction and collection commands
+        'pressionaapp': {
+            'handlers': ['console'],
+            'level': os.getenv('PRESSIONAAPP_LOG_LEVEL', 'INFO'),
+        },
+    },
+}
+
+
 # Password validation
 # https://docs.djangoproject.com/en/5.2/ref/settings/#auth-password-validators
 
@@ -1,6 +1,26 @@
 from django.contrib import admin
-from django.db.models import Q
+from django.contrib.contenttypes.models import ContentType
+from django.db.models import BooleanField, Case, Count, IntegerField, OuterRef, Q, Subquery, Value, When
+from django.db.models.functions import Coalesce, Length
+from django.utils.html import format_html
+from .admin_cache import get_partido_choices
 from .models import Deputado, Senador, TwitterMessage, Tweet
+from .twitter_utils import TWEET_ID_RE, TWITTER_URL_RE
+
+
+def tweet_count_subquery(model):
+    """Count a parliamentarian's tweets in the database instead of per row"""
+    tweets = Tweet.objects.filter(
+        content_type=ContentType.objects.get_for_model(model),
+        object_id=OuterRef('pk'),
+    ).order_by().values('object_id').annotate(total=Count('pk')).values('total')
+    return Coalesce(Subquery(tweets, output_field=IntegerField()), Value(0))
+
+
+def is_changelist_request(request):
+    """True when the admin queryset is being built for a changelist page"""
+    match = request.resolver_match
+    return bool(match and match.url_name and match.url_name.endswith('_changelist'))
 
 
 class HasTwitterProfileFilter(admin.SimpleListFilter):
@@ -27,6 +47,38 @@ class HasTwitterProfileFilter(admin.SimpleListFilter):
                 Q(twitter_url__exact='N/A')
             )
 
+
+class UfListFilter(admin.SimpleListFilter):
+    title = 'Estado (UF)'
+    parameter_name = 'uf'
+    
+    # Static list avoids a SELECT DISTINCT on every changelist render
+    UFS = (
+        'AC', 'AL', 'AM', 'AP', 'BA', 'CE', 'DF', 'ES', 'GO', 'MA', 'MG', 'MS', 'MT', 'PA',
+        'PB', 'PE', 'PI', 'PR', 'RJ', 'RN', 'RO', 'RR', 'RS', 'SC', 'SE', 'SP', 'TO',
+    )
+    
+    def lookups(self, request, model_admin):
+        return tuple((uf, uf) for uf in self.UFS)
+    
+    def queryset(self, request, queryset):
+        if self.value():
+            return queryset.filter(uf=self.value())
+
+
+class PartidoListFilter(admin.SimpleListFilter):
+    title = 'Partido'
+    parameter_name = 'partido'
+    
+    def lookups(self, request, model_admin):
+        partidos = get_partido_choices(model_admin.model)
+        return tuple((partido, partido) for partido in partidos)
+    
+    def queryset(self, request, queryset):
+        if self.value():
+            return queryset.filter(partido=self.value())
+
+
 @admin.register(TwitterMessage)
 class TwitterMessageAdmin(admin.ModelAdmin):
     list_display = [
@@ -36,15 +88,17 @@ class TwitterMessageAdmin(admin.ModelAdmin):
     ]
     list_filter = [
         'category', 'priority', 'status', 'for_deputies', 'for_senators',
-        'created_at', 'created_by'
+        'created_at', ('created_by', admin.RelatedOnlyFieldListFilter)
     ]
     search_fields = [
         'title', 'message', 'hashtags', 'mentions'
     ]
+    autocomplete_fields = ['created_by']
     readonly_fields = [
         'character_count', 'remaining_characters', 'times_used', 
         'last_used_at', 'created_at', 'updated_at', 'sent_at'
     ]
+    show_full_result_count = False
     
     fieldsets = (
         ('Conteúdo da Mensagem', {
@@ -81,12 +135,26 @@ class TwitterMessageAdmin(admin.ModelAdmin):
         })
     )
     
+    def get_queryset(self, request):
+        # Count characters in the database rather than per row in Python
+        queryset = super().get_queryset(request).annotate(_character_count=Length('message'))
+        if is_changelist_request(request):
+            # Text columns are not rendered on the changelist
+            queryset = queryset.defer(
+                'message', 'hashtags', 'mentions', 'target_parties', 'target_states'
+            )
+        return queryset
+    
+    @admin.display(description='Caracteres', ordering='_character_count')
     def character_count(self, obj):
+        # Unsaved objects on the add form have no annotation
+        if hasattr(obj, '_character_count'):
+            return obj._character_count
         return obj.character_count
-    character_count.short_description = 'Caracteres'
     
     def save_model(self, request, obj, form, change):
-        if not change:  # Only set created_by for new objects
+        # Default the author on insert without overriding an explicit choice
+        if not change and obj.created_by_id is None:
             obj.created_by = request.user
         super().save_model(request, obj, form, change)
 
@@ -106,7 +174,9 @@ class TweetAdmin(admin.ModelAdmin):
     readonly_fields = [
         'discovered_at', 'tweet_id'
     ]
-    
+    show_full_result_count = False
+    list_select_related = ['content_type']
+
     fieldsets = (
         ('Tweet Info', {
             'fields': (
@@ -130,43 +200,63 @@ class TweetAdmin(admin.ModelAdmin):
             'classes': ('collapse',)
         })
     )
-    
+
+    def get_queryset(self, request):
+        # Resolve the generic parliamentarian relation in one query per content type
+        queryset = super().get_queryset(request).prefetch_related('parliamentarian')
+        if is_changelist_request(request):
+            # The changelist only needs to know whether the tweet text is blank. SQL TRIM strips
+            # spaces only; on SQLite REGEXP runs Python's re, so \S agrees with str.strip()
+            queryset = queryset.defer('tweet_text').annotate(
+                _has_content=Case(
+                    When(tweet_text__regex=r'\S', then=Value(True)),
+                    default=Value(False),
+                    output_field=BooleanField(),
+                )
+            )
+        return queryset
+
+    @admin.display(description='Parlamentar')
     def get_parliamentarian_name(self, obj):
         if obj.parliamentarian:
             return obj.parliamentarian.nome_parlamentar
         return "N/A"
-    get_parliamentarian_name.short_description = 'Parlamentar'
     
+    @admin.display(description='Tipo', ordering='content_type__model')
     def get_parliamentarian_type(self, obj):
         if obj.content_type:
             return obj.content_type.model.title()
         return "N/A"
-    get_parliamentarian_type.short_description = 'Tipo'
-    get_parliamentarian_type.admin_order_field = 'content_type__model'
     
+    @admin.display(boolean=True, description='Tem Conteúdo')
     def has_content(self, obj):
+        if hasattr(obj, '_has_content'):
+            return obj._has_content
         return bool(obj.tweet_text and obj.tweet_text.strip())
-    has_content.boolean = True
-    has_content.short_description = 'Tem Conteúdo'
 
 
-@admin.register(Deputado)
-class DeputadoAdmin(admin.ModelAdmin):
+class ParlamentarAdmin(admin.ModelAdmin):
+    """Shared changelist and actions for Deputado and Senador admins"""
+    # Plural label used in action feedback messages
+    parlamentar_label = 'parlamentar(es)'
+    
     list_display = [
         'nome_parlamentar', 'has_twitter', 'partido', 'uf',
         'latest_tweet_link', 'tweet_count',
         'social_media_source', 'social_media_confidence', 'needs_social_media_review', 'is_active'
     ]
     list_filter = [
-        'partido', 'uf', 'is_active', 'social_media_confidence', 
+        PartidoListFilter, UfListFilter, 'is_active', 'social_media_confidence', 
         'needs_social_media_review', 'social_media_source', HasTwitterProfileFilter, 'created_at'
     ]
+    # Party and state are short codes: match them exactly instead of by substring
     search_fields = [
-        'nome_parlamentar', 'partido', 'uf', 'email'
+        'nome_parlamentar', '=partido', '=uf', 'email'
     ]
     readonly_fields = [
         'api_id', 'created_at', 'updated_at'
     ]
+    show_full_result_count = False
     
     fieldsets = (
         ('Informações Básicas', {
@@ -204,15 +294,12 @@ class DeputadoAdmin(admin.ModelAdmin):
         })
     )
     
+    @admin.display(description='Twitter', ordering='twitter_url')
     def has_twitter(self, obj):
         if obj.twitter_url:
-            from django.utils.html import format_html
-            import re
-            
             # Extract username from Twitter/X URL using regex
             # Handle both twitter.com and x.com, with or without @ in URL
-            pattern = r'(?:https?://)?(?:www\.)?(?:twitter\.com|x\.com)/(?:@)?(\w+)(?:\?.*)?'
-            match = re.match(pattern, obj.twitter_url)
+            match = TWITTER_URL_RE.match(obj.twitter_url)
             
             if match:
                 username = match.group(1)
@@ -229,16 +316,12 @@ class DeputadoAdmin(admin.ModelAdmin):
                     obj.twitter_url
                 )
         return '-'
-    has_twitter.short_description = 'Twitter'
-    has_twitter.allow_tags = True
     
+    @admin.display(description='Último Tweet')
     def latest_tweet_link(self, obj):
         if obj.latest_tweet_url:
-            from django.utils.html import format_html
-            import re
-            
             # Extract tweet ID from URL for display
-            tweet_id_match = re.search(r'/status/(\d+)', obj.latest_tweet_url)
+            tweet_id_match = TWEET_ID_RE.search(obj.latest_tweet_url)
             if tweet_id_match:
                 tweet_id = tweet_id_match.group(1)
                 # Show short tweet ID as clickable link
@@ -254,192 +337,55 @@ class DeputadoAdmin(admin.ModelAdmin):
                     obj.latest_tweet_url
                 )
         # Show red X when no latest tweet
-        from django.utils.html import format_html
         return format_html('<span style="color: red; font-weight: bold;">✗</span>')
-    latest_tweet_link.short_description = 'Último Tweet'
-    latest_tweet_link.allow_tags = True
-    
-    def tweet_count(self, obj):
-        from django.contrib.contenttypes.models import ContentType
-        content_type = ContentType.objects.get_for_model(obj)
-        return Tweet.objects.filter(content_type=content_type, object_id=obj.id).count()
-    tweet_count.short_description = 'Tweets'
-    
-    def get_tweets_display(self, obj):
-        from django.contrib.contenttypes.models import ContentType
-        from django.utils.html import format_html
-        
-        content_type = ContentType.objects.get_for_model(obj)
-        tweets = Tweet.objects.filter(content_type=content_type, object_id=obj.id).order_by('position')
-        
-        if not tweets:
-            return "Nenhum tweet encontrado"
-        
-        tweet_links = []
-        for tweet in tweets:
-            tweet_links.append(
-                f'<a href="{tweet.tweet_url}" target="_blank">Tweet {tweet.position}</a>'
-            )
-        
-        return format_html('<br>'.join(tweet_links))
-    get_tweets_display.short_description = 'Tweets'
-    get_tweets_display.allow_tags = True
-    
-    actions = ['mark_for_social_media_review', 'clear_social_media_review_flag']
     
-    def mark_for_social_media_review(self, request, queryset):
-        """Mark selected deputies for social media review"""
-        updated = queryset.update(needs_social_media_review=True)
-        self.message_user(
-            request, 
-            f'{updated} deputado(s) marcado(s) para revisão de redes sociais.'
-        )
-    mark_for_social_media_review.short_description = 'Marcar para revisão de redes sociais'
-    
-    def clear_social_media_review_flag(self, request, queryset):
-        """Remove selected deputies from social media review"""
-        updated = queryset.update(needs_social_media_review=False)
-        self.message_user(
-            request, 
-            f'{updated} deputado(s) removido(s) da revisão de redes sociais.'
-        )
-    clear_social_media_review_flag.short_description = 'Remover da revisão de redes sociais'
-
-
-@admin.register(Senador)
-class SenadorAdmin(admin.ModelAdmin):
-    list_display = [
-        'nome_parlamentar', 'has_twitter', 'partido', 'uf',
-        'latest_tweet_link', 'tweet_count',
+    # Columns needed to render the changelist rows
+    changelist_fields = (
+        'nome_parlamentar', 'partido', 'uf', 'twitter_url', 'latest_tweet_url',
         'social_media_source', 'social_media_confidence', 'needs_social_media_review', 'is_active'
-    ]
-    list_filter = [
-        'partido', 'uf', 'is_active', 'social_media_confidence', 
-        'needs_social_media_review', 'social_media_source', HasTwitterProfileFilter, 'created_at'
-    ]
-    search_fields = [
-        'nome_parlamentar', 'partido', 'uf', 'email'
-    ]
-    readonly_fields = [
-        'api_id', 'created_at', 'updated_at'
-    ]
-    
-    fieldsets = (
-        ('Informações Básicas', {
-            'fields': (
-                'nome_parlamentar', 'api_id', 'is_active'
-            )
-        }),
-        ('Informações Políticas', {
-            'fields': (
-                'partido', 'uf'
-            )
-        }),
-        ('Contato', {
-            'fields': (
-                'email', 'telefone', 'foto_url'
-            )
-        }),
-        ('Twitter', {
-            'fields': (
-                'twitter_url', 'latest_tweet_url'
-            )
-        }),
-        ('Dados de Redes Sociais', {
-            'fields': (
-                'social_media_source', 'social_media_confidence', 
-                'needs_social_media_review'
-            ),
-            'description': 'Informações sobre a fonte e confiabilidade dos dados de redes sociais'
-        }),
-        ('Metadados', {
-            'fields': (
-                'created_at', 'updated_at'
-            ),
-            'classes': ('collapse',)
-        })
     )
     
-    def has_twitter(self, obj):
-        if obj.twitter_url:
-            from django.utils.html import format_html
-            import re
-            
-            # Extract username from Twitter/X URL using regex
-            # Handle both twitter.com and x.com, with or without @ in URL
-            pattern = r'(?:https?://)?(?:www\.)?(?:twitter\.com|x\.com)/(?:@)?(\w+)(?:\?.*)?'
-            match = re.match(pattern, obj.twitter_url)
-            
-            if match:
-                username = match.group(1)
-                return format_html(
-                    '<a href="{}" target="_blank">@{}</a>',
-                    obj.twitter_url,
-                    username
-                )
-            else:
-                # Fallback: just show the URL if pattern doesn't match
-                return format_html(
-                    '<a href="{}" target="_blank">{}</a>',
-                    obj.twitter_url,
-                    obj.twitter_url
-                )
-        return '-'
-    has_twitter.short_description = 'Twitter'
-    has_twitter.allow_tags = True
-    
-    def latest_tweet_link(self, obj):
-        if obj.latest_tweet_url:
-            from django.utils.html import format_html
-            import re
-            
-            # Extract tweet ID from URL for display
-            tweet_id_match = re.search(r'/status/(\d+)', obj.latest_tweet_url)
-            if tweet_id_match:
-                tweet_id = tweet_id_match.group(1)
-                # Show short tweet ID as clickable link
-                return format_html(
-                    '<a href="{}" target="_blank">Tweet #{}</a>',
-                    obj.latest_tweet_url,
-                    tweet_id[-6:]  # Last 6 digits of tweet ID
-                )
-            else:
-                # Fallback: show "Tweet" if URL doesn't match pattern
-                return format_html(
-                    '<a href="{}" target="_blank">Tweet</a>',
-                    obj.latest_tweet_url
-                )
-        # Show red X when no latest tweet
-        from django.utils.html import format_html
-        return format_html('<span style="color: red; font-weight: bold;">✗</span>')
-    latest_tweet_link.short_description = 'Último Tweet'
-    latest_tweet_link.allow_tags = True
-    
+    def get_queryset(self, request):
+        queryset = super().get_queryset(request).annotate(
+            _tweet_count=tweet_count_subquery(self.model)
+        )
+        if is_changelist_request(request):
+            queryset = queryset.only(*self.changelist_fields)
+        return queryset
+
+    @admin.display(description='Tweets', ordering='_tweet_count')
     def tweet_count(self, obj):
-        from django.contrib.contenttypes.models import ContentType
-        content_type = ContentType.objects.get_for_model(obj)
-        return Tweet.objects.filter(content_type=content_type, object_id=obj.id).count()
-    tweet_count.short_description = 'Tweets'
+        return obj._tweet_count
     
     actions = ['mark_for_social_media_review', 'clear_social_media_review_flag']
     
+    @admin.action(description='Marcar para revisão de redes sociais')
     def mark_for_social_media_review(self, request, queryset):
-        """Mark selected senators for social media review"""
+        """Mark selected parliamentarians for social media review"""
         updated = queryset.update(needs_social_media_review=True)
         self.message_user(
             request, 
-            f'{updated} senador(es) marcado(s) para revisão de redes sociais.'
+            f'{updated} {self.parlamentar_label} marcado(s) para revisão de redes sociais.'
         )
-    mark_for_social_media_review.short_description = 'Marcar para revisão de redes sociais'
     
+    @admin.action(description='Remover da revisão de redes sociais')
     def clear_social_media_review_flag(self, request, queryset):
-        """Remove selected senators from social media review"""
+        """Remove selected parliamentarians from social media review"""
         updated = queryset.update(needs_social_media_review=False)
         self.message_user(
             request, 
-            f'{updated} senador(es) removido(s) da revisão de redes sociais.'
+            f'{updated} {self.parlamentar_label} removido(s) da revisão de redes sociais.'
         )
-    clear_social_media_review_flag.short_description = 'Remover da revisão de redes sociais'
+
+
+@admin.register(Deputado)
+class DeputadoAdmin(ParlamentarAdmin):
+    parlamentar_label = 'deputado(s)'
+
+
+@admin.register(Senador)
+class SenadorAdmin(ParlamentarAdmin):
+    parlamentar_label = 'senador(es)'
 
 
 # Admin site customization
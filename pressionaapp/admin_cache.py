@@ -0,0 +1,30 @@
+"""
+Party filter choices for the parliamentarian admins
+Kept in a cache shared by the web and command processes, so the extraction
+commands can invalidate them after their bulk writes (which send no signals)
+"""
+
+from django.core.cache import caches
+
+ADMIN_CACHE_ALIAS = 'admin'
+
+# Party lists change only when the extractors run, so the DISTINCT scan is cached
+PARTIDO_CHOICES_TIMEOUT = 60 * 60
+
+
+def partido_choices_cache_key(model):
+    return f'pressionaapp:admin_partido_choices:{model._meta.model_name}'
+
+
+def get_partido_choices(model):
+    """Distinct parties of a parliamentarian model, from the cache when available"""
+    return caches[ADMIN_CACHE_ALIAS].get_or_set(
+        partido_choices_cache_key(model),
+        lambda: list(model.objects.order_by('partido').values_list('partido', flat=True).distinct()),
+        PARTIDO_CHOICES_TIMEOUT
+    )
+
+
+def clear_partido_choices(sender, **kwargs):
+    """Drop the cached parties of a model; also connected as a post_save/post_delete receiver"""
+    caches[ADMIN_CACHE_ALIAS].delete(partido_choices_cache_key(sender))
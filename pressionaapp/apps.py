@@ -4,3 +4,14 @@ from django.apps import AppConfig
 class BlindagemappConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'pressionaapp'
+    
+    def ready(self):
+        from django.db.models.signals import post_delete, post_save
+        from .admin_cache import clear_partido_choices
+        
+        # Wired here so saves from commands and the shell invalidate the admin cache too
+        for model in (self.get_model('Deputado'), self.get_model('Senador')):
+            post_save.connect(clear_partido_choices, sender=model,
+                              dispatch_uid=f'admin_partido_choices_save_{model.__name__}')
+            post_delete.connect(clear_partido_choices, sender=model,
+                                dispatch_uid=f'admin_partido_choices_delete_{model.__name__}')
@@ -8,19 +8,82 @@ New Flow:
 
 import requests
 import logging
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from typing import Dict, List, Optional
 from django.db import transaction
+from django.utils import timezone
 from .models import Deputado
 from .grok_service import GrokTwitterService, GrokAPIError
-from bs4 import BeautifulSoup
+from .admin_cache import clear_partido_choices
+from .http_cache import cached_get
+from .twitter_utils import clean_twitter_url
+from bs4 import BeautifulSoup, SoupStrainer
 import re
-import time
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from datetime import datetime, timedelta
 
-# Configure logging
-logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Parallel requests used to prefetch deputy details from the Chamber API
+MAX_CONCURRENT_REQUESTS = 8
+
+# Rows per INSERT/UPDATE statement when saving extracted deputies
+BULK_BATCH_SIZE = 200
+
+# Fields refreshed on existing deputies by extract_deputies
+DEPUTY_UPDATE_FIELDS = [
+    'nome_parlamentar', 'partido', 'uf', 'email', 'telefone', 'foto_url',
+    'twitter_url', 'social_media_source', 'social_media_confidence',
+    'needs_social_media_review', 'is_active', 'updated_at',
+]
+
+# The legislature's deputy list changes rarely; reuse a downloaded copy for an hour
+CURRENT_DEPUTIES_MAX_AGE = 60 * 60
+
+# The deputy pages send no cache validators; reuse a downloaded page for a day
+CHAMBER_PAGE_MAX_AGE = 60 * 60 * 24
+
+# CSS selectors for the social media block of a deputy's page on camara.leg.br;
+# the widget and link selectors are applied within the block only
+SOCIAL_MEDIA_BLOCK_SELECTOR = 'div.l-grid-social-media'
+
+# Only the social media block is built into a tree; head, scripts and footer are skipped.
+# A plain class string only matches the exact attribute, so the class is matched as a token
+SOCIAL_MEDIA_STRAINER = SoupStrainer('div', class_=re.compile(r'(?:^|\s)l-grid-social-media(?:\s|$)'))
+TWITTER_WIDGET_SELECTOR = 'div[class*="widget-twitter"]'
+TWITTER_LINK_SELECTOR = 'a[href*="twitter.com"], a[href*="x.com"]'
+
+# Official Chamber identifiers, lowercased once for case-insensitive matching
+OFFICIAL_CAMARA_PATTERNS = tuple(pattern.lower() for pattern in (
+    'camaradeputados',
+    'camara.leg.br',
+    'camaradosdeputados',
+    'UC-ZkSRh-7UEuwXJQ9UMCFJA',  # Official YouTube channel
+    '/camaradeputados',
+    '@camaradeputados',
+    '@camaradosdeputados',
+    'camaradeputados.leg.br',
+    'camaradeputados.com.br',
+    'camaradeputados.org.br',
+    'camara.net.br',
+    'camaradeputados.net.br',
+    'deputadoscamara',
+    'camara-deputados',
+    'camarabrasil',
+    'congressonacional',
+))
+
+# All official patterns folded into one alternation, so a URL is scanned once
+OFFICIAL_CAMARA_RE = re.compile('|'.join(map(re.escape, OFFICIAL_CAMARA_PATTERNS)))
+
+
+@lru_cache(maxsize=4096)
+def is_official_camara_url(url: str) -> bool:
+    """Check a URL against the official Chamber patterns; the same footer links recur on every page"""
+    return OFFICIAL_CAMARA_RE.search(url.lower()) is not None
+
 
 class DeputadosDataExtractor:
     """
@@ -35,36 +98,36 @@ class DeputadosDataExtractor:
             'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
         })
         
+        # Reuse connections across the concurrent detail fetches and retry transient failures
+        adapter = HTTPAdapter(
+            pool_connections=4,
+            pool_maxsize=MAX_CONCURRENT_REQUESTS,
+            max_retries=Retry(total=5, backoff_factor=0.3, status_forcelist=[429, 500, 502, 503, 504])
+        )
+        self.session.mount('https://', adapter)
+        
+        self._current_deputies = None
+        
         # Initialize Grok service
         try:
             self.grok_service = GrokTwitterService()
             logger.info("Grok Twitter service initialized successfully")
         except ValueError as e:
-            logger.error(f"Failed to initialize Grok service: {e}")
+            logger.error("Failed to initialize Grok service: %s", e)
             self.grok_service = None
     
-    def _clean_twitter_url(self, url: str) -> str:
-        """Clean Twitter URL to standardized format without @ or www"""
-        if not url:
-            return url
-            
-        import re
-        # Remove protocol, www, and extract clean username
-        pattern = r'(?:https?://)?(?:www\.)?(?:twitter\.com|x\.com)/(?:@)?(\w+)(?:\?.*)?(?:#.*)?'
-        match = re.match(pattern, url.strip())
-        
-        if match:
-            username = match.group(1)
-            # Return clean X.com URL format
-            return f"https://x.com/{username}"
-        
-        # If pattern doesn't match, return original URL
-        return url.strip()
-        
+    def close(self):
+        """Release the pooled HTTP connections"""
+        self.session.close()
+    
     def get_current_deputies(self):
         """
         Get all active deputies from current legislature
         """
+        # The list is fetched once per extractor; later calls reuse it
+        if self._current_deputies is not None:
+            return list(self._current_deputies)
+        
         try:
             url = f"{self.base_url}/deputados"
             params = {
@@ -73,13 +136,22 @@ class DeputadosDataExtractor:
                 'ordenarPor': 'nome'
             }
             
-            response = self.session.get(url, params=params)
-            response.raise_for_status()
+            deputies = []
+            while url:
+                response = cached_get(self.session, url, params=params, max_age=CURRENT_DEPUTIES_MAX_AGE)
+                response.raise_for_status()
+                
+                data = response.json()
+                deputies.extend(data.get('dados', []))
+                
+                # Follow the API's pagination links; the 'next' href already carries the query string
+                url = next((link['href'] for link in data.get('links', []) if link.get('rel') == 'next'), None)
+                params = None
             
-            data = response.json()
-            return data.get('dados', [])
+            self._current_deputies = deputies
+            return list(self._current_deputies)
         except Exception as e:
-            logger.error(f"Error fetching deputies: {str(e)}")
+            logger.error("Error fetching deputies: %s", e)
             return []
 
     def get_deputy_details(self, deputy_id: int) -> Dict:
@@ -94,54 +166,83 @@ class DeputadosDataExtractor:
         """
         try:
             url = f"{self.base_url}/deputados/{deputy_id}"
-            response = self.session.get(url)
+            response = cached_get(self.session, url)
             response.raise_for_status()
             
             data = response.json()
             return data.get('dados', {})
         except Exception as e:
-            logger.error(f"Error fetching deputy details for ID {deputy_id}: {str(e)}")
+            logger.error("Error fetching deputy details for ID %s: %s", deputy_id, e)
             return {}
 
+    def get_deputies_details(self, deputy_ids: List[int]) -> Dict[int, Dict]:
+        """
+        Fetch details for several deputies concurrently
+        
+        Args:
+            deputy_ids: The deputies' API IDs
+            
+        Returns:
+            Dictionary mapping each API ID to its detailed information
+        """
+        with ThreadPoolExecutor(max_workers=MAX_CONCURRENT_REQUESTS) as executor:
+            return dict(zip(deputy_ids, executor.map(self.get_deputy_details, deputy_ids)))
+
+    def _get_search_name(self, deputy_data: Dict, deputy_details: Dict) -> str:
+        """Full civil name for more accurate Grok searches, falling back to the parliamentary name"""
+        nome_civil = deputy_details.get('nomeCivil', '') if deputy_details else ''
+        if nome_civil:
+            return nome_civil.title()  # Convert to title case for better readability
+        return deputy_data.get('nome', '')
+    
+    def extract_twitter_infos(self, deputies_data: List[Dict], deputies_details: Dict[int, Dict]) -> Dict[int, Dict]:
+        """
+        Run the Twitter extraction flow for several deputies concurrently
+        
+        Args:
+            deputies_data: Deputies from the Chamber API list
+            deputies_details: Details already fetched for those deputies, by API ID
+            
+        Returns:
+            Dictionary mapping each API ID to its extract_twitter_info result
+        """
+        def extract(deputy_data):
+            api_id = deputy_data['id']
+            deputy_details = deputies_details.get(api_id, {})
+            return api_id, self.extract_twitter_info(
+                deputado_id=api_id,
+                nome=self._get_search_name(deputy_data, deputy_details),
+                nome_parlamentar=deputy_data.get('nome', ''),
+                partido=deputy_data.get('siglaPartido', ''),
+                uf=deputy_data.get('siglaUf', ''),
+                deputy_details=deputy_details
+            )
+        
+        with ThreadPoolExecutor(max_workers=MAX_CONCURRENT_REQUESTS) as executor:
+            return dict(executor.map(extract, [d for d in deputies_data if d.get('id')]))
+
     def _is_official_camara_link(self, url: str) -> bool:
         """
         Check if a URL is from official Chamber of Deputies accounts
         """
         if not url:
             return False
-            
-        url_lower = url.lower()
-        
-        # List of official Chamber identifiers
-        official_patterns = [
-            'camaradeputados',
-            'camara.leg.br',
-            'camaradosdeputados',
-            'UC-ZkSRh-7UEuwXJQ9UMCFJA',  # Official YouTube channel
-            '/camaradeputados',
-            '@camaradeputados',
-            '@camaradosdeputados',
-            'camaradeputados.leg.br',
-            'camaradeputados.com.br',
-            'camaradeputados.org.br',
-            'camara.net.br',
-            'camaradeputados.net.br',
-            'deputadoscamara',
-            'camara-deputados',
-            'camarabrasil',
-            'congressonacional',
-        ]
         
-        return any(pattern.lower() in url_lower for pattern in official_patterns)
+        return is_official_camara_url(url)
     
     def extract_twitter_info(self, deputado_id: int, nome: str = None, nome_parlamentar: str = None, 
-                           partido: str = None, uf: str = None) -> Dict[str, any]:
+                           partido: str = None, uf: str = None,
+                           deputy_details: Optional[Dict] = None, api_only: bool = False) -> Dict[str, any]:
         """
         Extract Twitter account using the 3-step flow:
         1. Try Chamber API
         2. Try Chamber website scraping
         3. Try Grok API fallback (if no Twitter found)
         
+        Args:
+            deputy_details: Details already fetched from the Chamber API, to avoid fetching them again
+            api_only: Stop after step 1, for deputies whose stored profile is already confirmed
+        
         Returns:
             Dictionary containing Twitter URL and metadata
         """
@@ -157,79 +258,84 @@ class DeputadosDataExtractor:
         }
         
         # STEP 1: Try to get Twitter from official Chamber API
-        logger.info(f"Step 1: Checking Chamber API for deputy {deputado_id} ({nome_parlamentar})")
+        logger.debug("Step 1: Checking Chamber API for deputy %s (%s)", deputado_id, nome_parlamentar)
         try:
-            deputy_details = self.get_deputy_details(deputado_id)
+            if deputy_details is None:
+                deputy_details = self.get_deputy_details(deputado_id)
             official_social_media = deputy_details.get('redeSocial', [])
             
             if official_social_media:
-                logger.info(f"Found {len(official_social_media)} official social media links")
+                logger.debug("Found %s official social media links", len(official_social_media))
                 
                 # Look for Twitter/X only
                 for url_item in official_social_media:
                     url_lower = url_item.lower()
                     
                     if 'twitter.com' in url_lower or 'x.com' in url_lower:
-                        result['twitter_url'] = self._clean_twitter_url(url_item)
+                        result['twitter_url'] = clean_twitter_url(url_item)
                         result['metadata']['source'] = 'official_api'
                         result['metadata']['confidence'] = 'high'
                         result['metadata']['details'] = 'Found Twitter in official Chamber API'
                         result['metadata']['extraction_method'].append('chamber_api')
-                        logger.info(f"✓ Found Twitter in API: {url_item}")
+                        logger.debug("✓ Found Twitter in API: %s", url_item)
                         break
                         
         except Exception as e:
-            logger.warning(f"Error in Step 1 (Chamber API): {str(e)}")
+            logger.warning("Error in Step 1 (Chamber API): %s", e)
+        
+        if api_only:
+            return result
         
         # STEP 2: Try Chamber website scraping if not found in API
         if not result['twitter_url']:
-            logger.info(f"Step 2: Scraping Chamber website for deputy {deputado_id}")
+            logger.debug("Step 2: Scraping Chamber website for deputy %s", deputado_id)
             try:
                 url = f"https://www.camara.leg.br/deputados/{deputado_id}"
-                response = self.session.get(url, timeout=10)
+                response = cached_get(self.session, url, timeout=10, max_age=CHAMBER_PAGE_MAX_AGE)
                 response.raise_for_status()
                 
-                soup = BeautifulSoup(response.content, 'html.parser')
+                # lxml's C parser is much faster than html.parser and is already a requirement
+                soup = BeautifulSoup(response.content, 'lxml', parse_only=SOCIAL_MEDIA_STRAINER)
+                
+                # Find the social media block once and search only inside it
+                social_media_div = soup.select_one(SOCIAL_MEDIA_BLOCK_SELECTOR)
                 
                 # Look for Twitter widget in social media div
-                social_media_div = soup.find('div', class_='l-grid-social-media')
-                if social_media_div:
-                    # Look for Twitter widget specifically
-                    twitter_widget = social_media_div.find('div', class_=lambda x: x and 'widget-twitter' in x)
-                    if twitter_widget:
-                        twitter_handle = twitter_widget.get('data-urlTwitter')
-                        if twitter_handle:
-                            if not twitter_handle.startswith('http'):
-                                result['twitter_url'] = self._clean_twitter_url(f"https://x.com/{twitter_handle.lstrip('@')}")
-                            else:
-                                result['twitter_url'] = self._clean_twitter_url(twitter_handle)
-                            
-                            result['metadata']['source'] = 'chamber_website'
-                            result['metadata']['confidence'] = 'high'
-                            result['metadata']['details'] = 'Found Twitter widget in Chamber website'
-                            result['metadata']['extraction_method'].append('chamber_website_widget')
-                            logger.info(f"✓ Found Twitter widget: {result['twitter_url']}")
+                twitter_widget = social_media_div.select_one(TWITTER_WIDGET_SELECTOR) if social_media_div else None
+                if twitter_widget:
+                    # HTML parsers lowercase attribute names, so data-urlTwitter is read as data-urltwitter
+                    twitter_handle = twitter_widget.get('data-urltwitter')
+                    if twitter_handle:
+                        if not twitter_handle.startswith('http'):
+                            result['twitter_url'] = clean_twitter_url(f"https://x.com/{twitter_handle.removeprefix('@')}")
+                        else:
+                            result['twitter_url'] = clean_twitter_url(twitter_handle)
+                        
+                        result['metadata']['source'] = 'chamber_website'
+                        result['metadata']['confidence'] = 'high'
+                        result['metadata']['details'] = 'Found Twitter widget in Chamber website'
+                        result['metadata']['extraction_method'].append('chamber_website_widget')
+                        logger.debug("✓ Found Twitter widget: %s", result['twitter_url'])
                 
                 # Also check for Twitter links if widget not found
                 if not result['twitter_url'] and social_media_div:
-                    twitter_links = social_media_div.find_all('a', href=re.compile(r'(twitter\.com|x\.com)'))
-                    for link in twitter_links:
+                    for link in social_media_div.select(TWITTER_LINK_SELECTOR):
                         href = link.get('href', '')
                         if not self._is_official_camara_link(href):
-                            result['twitter_url'] = self._clean_twitter_url(href)
+                            result['twitter_url'] = clean_twitter_url(href)
                             result['metadata']['source'] = 'chamber_website'
                             result['metadata']['confidence'] = 'medium'
                             result['metadata']['details'] = 'Found Twitter link in Chamber website'
                             result['metadata']['extraction_method'].append('chamber_website_scraping')
-                            logger.info(f"✓ Found Twitter link: {result['twitter_url']}")
+                            logger.debug("✓ Found Twitter link: %s", result['twitter_url'])
                             break
                             
             except Exception as e:
-                logger.warning(f"Error in Step 2 (Chamber website): {str(e)}")
+                logger.warning("Error in Step 2 (Chamber website): %s", e)
         
         # STEP 3: Use Grok API fallback if still no Twitter found
         if not result['twitter_url'] and self.grok_service:
-            logger.info(f"Step 3: Using Grok API fallback for deputy {nome_parlamentar}")
+            logger.debug("Step 3: Using Grok API fallback for deputy %s", nome_parlamentar)
             try:
                 # Build additional context for Grok search
                 additional_context = []
@@ -240,6 +346,7 @@ class DeputadosDataExtractor:
                 
                 context_str = " ".join(additional_context) if additional_context else None
                 
+                # GrokTwitterService rate-limits its own requests across threads
                 grok_profile = self.grok_service.find_twitter_profile(
                     nome=nome,
                     nome_parlamentar=nome_parlamentar,
@@ -248,7 +355,7 @@ class DeputadosDataExtractor:
                 )
                 
                 if grok_profile:
-                    result['twitter_url'] = self._clean_twitter_url(grok_profile['url'])
+                    result['twitter_url'] = clean_twitter_url(grok_profile['url'])
                     result['metadata']['source'] = 'grok_api'
                     result['metadata']['confidence'] = 'medium' if grok_profile['confidence_score'] > 0.7 else 'low'
                     # Always set needs_review=True for Grok-discovered profiles for human verification
@@ -256,20 +363,21 @@ class DeputadosDataExtractor:
                     result['metadata']['details'] = f"Grok API found profile (confidence: {grok_profile['confidence_score']}) - marked for review"
                     result['metadata']['extraction_method'].append('grok_fallback')
                     result['metadata']['grok_profile_data'] = grok_profile
-                    logger.info(f"✓ Grok found Twitter: {result['twitter_url']} (confidence: {grok_profile['confidence_score']}) - MARKED FOR REVIEW")
+                    logger.info("✓ Grok found Twitter: %s (confidence: %s) - MARKED FOR REVIEW", result['twitter_url'], grok_profile['confidence_score'])
                     
             except Exception as e:
-                logger.warning(f"Error in Step 3 (Grok fallback): {str(e)}")
+                logger.warning("Error in Step 3 (Grok fallback): %s", e)
         
 
         
         # Log final result summary
         method_summary = " → ".join(result['metadata']['extraction_method'])
-        logger.info(f"Profile extraction complete for {nome_parlamentar}: {method_summary}")
-        logger.info(f"  Twitter URL: {'✓' if result['twitter_url'] else '✗'}")
-        logger.info(f"  Source: {result['metadata']['source']}")
-        logger.info(f"  Confidence: {result['metadata']['confidence']}")
-        logger.info(f"  Needs Review: {'✓ YES' if result['metadata']['needs_review'] else '✗ NO'} {'(Grok API discovery requires human verification)' if result['metadata']['source'] == 'grok_api' else ''}")
+        logger.info("Profile extraction complete for %s: %s", nome_parlamentar, method_summary)
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("  Twitter URL: %s", '✓' if result['twitter_url'] else '✗')
+            logger.debug("  Source: %s", result['metadata']['source'])
+            logger.debug("  Confidence: %s", result['metadata']['confidence'])
+            logger.debug("  Needs Review: %s %s", '✓ YES' if result['metadata']['needs_review'] else '✗ NO', '(Grok API discovery requires human verification)' if result['metadata']['source'] == 'grok_api' else '')
         
         return result
     
@@ -300,7 +408,7 @@ class DeputadosDataExtractor:
         existing_api_ids = set()
         if skip_existing:
             existing_api_ids = set(Deputado.objects.values_list('api_id', flat=True))
-            logger.info(f"Found {len(existing_api_ids)} existing deputies in database - will skip them")
+            logger.info("Found %s existing deputies in database - will skip them", len(existing_api_ids))
         
         # Filter out existing deputies if requested
         # NOTE: Even when skipping existing deputies, we still need to manage their active/inactive status
@@ -309,7 +417,7 @@ class DeputadosDataExtractor:
             original_count = len(deputies_data)
             deputies_data = [d for d in deputies_data if d.get('id') not in existing_api_ids]
             filtered_count = original_count - len(deputies_data)
-            logger.info(f"Filtered out {filtered_count} existing deputies. Processing {len(deputies_data)} new deputies.")
+            logger.info("Filtered out %s existing deputies. Processing %s new deputies.", filtered_count, len(deputies_data))
         
         created_count = 0
         updated_count = 0
@@ -318,34 +426,96 @@ class DeputadosDataExtractor:
         # Apply limit if specified
         if limit:
             deputies_data = deputies_data[:limit]
-            logger.info(f"Processing limited to {limit} deputies")
+            logger.info("Processing limited to %s deputies", limit)
+        
+        api_ids = [d.get('id') for d in deputies_data if d.get('id')]
+        
+        # Existing deputies are only re-activated when not updating, so nothing is fetched for them
+        fetched_api_ids = api_ids
+        if not update_existing:
+            stored_api_ids = set(Deputado.objects.filter(api_id__in=api_ids).values_list('api_id', flat=True))
+            fetched_api_ids = [api_id for api_id in api_ids if api_id not in stored_api_ids]
+        
+        # Fetch the deputies' details up front; the requests are I/O bound and independent
+        logger.info("Fetching details for %s deputies...", len(fetched_api_ids))
+        deputies_details = self.get_deputies_details(fetched_api_ids)
+        
+        # Deputies whose stored Twitter is already confirmed (high confidence, nothing to review)
+        # keep it, so the Chamber website and Grok are only consulted for the others
+        confirmed_profiles = Deputado.objects.filter(
+            api_id__in=fetched_api_ids, social_media_confidence='high', needs_social_media_review=False
+        ).exclude(twitter_url__isnull=True).exclude(twitter_url='').values(
+            'api_id', 'nome_parlamentar', 'twitter_url', 'social_media_source', 'social_media_confidence'
+        )
+        extraction_results = {}
+        for profile in confirmed_profiles:
+            api_id = profile['api_id']
+            # The Chamber API check reuses the prefetched details, so a changed handle is still picked up
+            api_result = self.extract_twitter_info(
+                deputado_id=api_id,
+                nome_parlamentar=profile['nome_parlamentar'],
+                deputy_details=deputies_details.get(api_id, {}),
+                api_only=True
+            )
+            if api_result['twitter_url']:
+                extraction_results[api_id] = api_result
+                continue
+            
+            extraction_results[api_id] = {
+                'twitter_url': profile['twitter_url'],
+                'metadata': {
+                    'source': profile['social_media_source'],
+                    'confidence': profile['social_media_confidence'],
+                    'needs_review': False,
+                    'details': 'Kept Twitter already confirmed in database',
+                    'extraction_method': ['database'],
+                }
+            }
+        
+        pending_deputies = [
+            d for d in deputies_data
+            if d.get('id') in deputies_details and d.get('id') not in extraction_results
+        ]
+        
+        # Twitter discovery is also I/O bound per deputy, so it runs before the transaction opens
+        logger.info("Extracting Twitter profiles for %s deputies (%s already confirmed)...", len(pending_deputies), len(extraction_results))
+        extraction_results.update(self.extract_twitter_infos(pending_deputies, deputies_details))
+        
+        # If skip_existing is enabled, we still need to mark existing deputies as active
+        # if they appear in the current API response (they're still serving)
+        if skip_existing and existing_api_ids:
+            # Get all API IDs from the OFFICIAL current deputies API (not legislature filtered)
+            # This ensures we sync with the same data source as the sync_deputy_status command;
+            # fetched before the transaction so no locks are held during the request
+            try:
+                response = self.session.get(f"{self.base_url}/deputados")
+                response.raise_for_status()
+                official_data = response.json()
+                all_current_api_ids = [d.get('id') for d in official_data.get('dados', []) if d.get('id')]
+            except Exception as e:
+                logger.warning("Could not fetch official current deputies for sync: %s", e)
+                # Fallback to the filtered data we already have
+                all_current_api_ids = [d.get('id') for d in self.get_current_deputies() if d.get('id')]
         
         with transaction.atomic():
             # First, mark all deputies as inactive
             Deputado.objects.all().update(is_active=False)
             
-            # If skip_existing is enabled, we still need to mark existing deputies as active
-            # if they appear in the current API response (they're still serving)
             if skip_existing and existing_api_ids:
-                # Get all API IDs from the OFFICIAL current deputies API (not legislature filtered)
-                # This ensures we sync with the same data source as the sync_deputy_status command
-                try:
-                    response = self.session.get(f"{self.base_url}/deputados")
-                    response.raise_for_status()
-                    official_data = response.json()
-                    all_current_api_ids = [d.get('id') for d in official_data.get('dados', []) if d.get('id')]
-                except Exception as e:
-                    logger.warning(f"Could not fetch official current deputies for sync: {e}")
-                    # Fallback to the filtered data we already have
-                    all_current_api_ids = [d.get('id') for d in self.get_current_deputies() if d.get('id')]
-                
                 # Mark existing deputies as active if they're still in the current API
                 existing_active_ids = set(all_current_api_ids).intersection(existing_api_ids)
                 if existing_active_ids:
                     Deputado.objects.filter(api_id__in=existing_active_ids).update(is_active=True)
-                    logger.info(f"Marked {len(existing_active_ids)} existing deputies as active (still serving)")
+                    logger.info("Marked %s existing deputies as active (still serving)", len(existing_active_ids))
                 else:
-                    logger.info(f"No existing deputies found in current API response")
+                    logger.info("No existing deputies found in current API response")
+            
+            # Load the deputies being processed in one query and write them back in bulk
+            existing_deputies = Deputado.objects.in_bulk(api_ids, field_name='api_id')
+            new_deputies = []
+            changed_deputies = {}
+            skipped_api_ids = []
+            now = timezone.now()
             
             for i, deputy_data in enumerate(deputies_data, 1):
                 try:
@@ -357,56 +527,53 @@ class DeputadosDataExtractor:
                     partido = deputy_data.get('siglaPartido', '')
                     uf = deputy_data.get('siglaUf', '')
                     
-                    logger.info(f"\n[{i}/{len(deputies_data)}] Processing: {nome_parlamentar} ({partido}-{uf})")
+                    logger.debug("\n[%s/%s] Processing: %s (%s-%s)", i, len(deputies_data), nome_parlamentar, partido, uf)
                     
-                    # Get detailed deputy information (including real name)
-                    deputy_details = self.get_deputy_details(api_id)
-                    nome = nome_parlamentar  # Default fallback
-                    if deputy_details:
-                        # Use the full civil name for more accurate Grok searches
-                        nome_civil = deputy_details.get('nomeCivil', '')
-                        if nome_civil:
-                            nome = nome_civil.title()  # Convert to title case for better readability
+                    deputy = existing_deputies.get(api_id)
+                    
+                    if deputy is not None and not update_existing:
+                        # Just mark as active (deputy exists but not updating)
+                        skipped_api_ids.append(api_id)
+                        skipped_count += 1
+                        logger.debug("✓ Skipped (already exists): %s", deputy.nome_parlamentar)
+                        continue
+                    
+                    # Get detailed deputy information
+                    deputy_details = deputies_details.get(api_id, {})
                     phone = None
                     if deputy_details:
                         office_info = deputy_details.get('ultimoStatus', {}).get('gabinete', {})
                         phone = office_info.get('telefone')
                     
-                    # Extract Twitter info using new 4-step flow
-                    extraction_result = self.extract_twitter_info(
-                        deputado_id=api_id,
-                        nome=nome,
-                        nome_parlamentar=nome_parlamentar,
-                        partido=partido,
-                        uf=uf
-                    )
+                    extraction_result = extraction_results[api_id]
                     
                     twitter_url = extraction_result.get('twitter_url')
                     metadata = extraction_result.get('metadata', {})
+                    twitter_fields = {
+                        'twitter_url': twitter_url,
+                        'social_media_source': metadata.get('source'),
+                        'social_media_confidence': metadata.get('confidence'),
+                        'needs_social_media_review': metadata.get('needs_review', False),
+                    }
+                    review_status = " [NEEDS SOCIAL MEDIA REVIEW]" if twitter_fields['needs_social_media_review'] else ""
                     
-                    # Get or create deputy
-                    deputy, created = Deputado.objects.get_or_create(
-                        api_id=api_id,
-                        defaults={
-                            'nome_parlamentar': nome_parlamentar,
-                            'partido': partido,
-                            'uf': uf,
-                            'email': deputy_data.get('email'),
-                            'telefone': phone,
-                            'foto_url': deputy_data.get('urlFoto'),
-                            'twitter_url': twitter_url,
-                            'social_media_source': metadata.get('source'),
-                            'social_media_confidence': metadata.get('confidence'),
-                            'needs_social_media_review': metadata.get('needs_review', False),
-                            'is_active': True
-                        }
-                    )
-                    
-                    if created:
+                    if deputy is None:
+                        deputy = Deputado(
+                            api_id=api_id,
+                            nome_parlamentar=nome_parlamentar,
+                            partido=partido,
+                            uf=uf,
+                            email=deputy_data.get('email'),
+                            telefone=phone,
+                            foto_url=deputy_data.get('urlFoto'),
+                            is_active=True,
+                            **twitter_fields
+                        )
+                        existing_deputies[api_id] = deputy
+                        new_deputies.append(deputy)
                         created_count += 1
-                        review_status = " [NEEDS SOCIAL MEDIA REVIEW]" if metadata.get('needs_review', False) else ""
-                        logger.info(f"✓ Created: {deputy.nome_parlamentar}{review_status}")
-                    elif update_existing:
+                        logger.info("✓ Created: %s%s", deputy.nome_parlamentar, review_status)
+                    else:
                         # Update existing deputy
                         deputy.nome_parlamentar = nome_parlamentar
                         deputy.partido = partido
@@ -423,37 +590,34 @@ class DeputadosDataExtractor:
                             deputy.foto_url = deputy_data['urlFoto']
                         
                         # Update Twitter info
-                        deputy.twitter_url = twitter_url
-                        deputy.social_media_source = metadata.get('source')
-                        deputy.social_media_confidence = metadata.get('confidence')
-                        deputy.needs_social_media_review = metadata.get('needs_review', False)
+                        for field, value in twitter_fields.items():
+                            setattr(deputy, field, value)
                         
-                        deputy.save()
+                        # bulk_update() does not apply auto_now
+                        deputy.updated_at = now
+                        if deputy.pk is not None:
+                            changed_deputies[api_id] = deputy
                         updated_count += 1
-                        review_status = " [NEEDS SOCIAL MEDIA REVIEW]" if metadata.get('needs_review', False) else ""
-                        logger.info(f"✓ Updated: {deputy.nome_parlamentar}{review_status}")
-                    else:
-                        # Just mark as active (deputy exists but not updating)
-                        deputy.is_active = True
-                        deputy.save()
-                        skipped_count += 1
-                        logger.info(f"✓ Skipped (already exists): {deputy.nome_parlamentar}")
-                    
-
-                    
-                    # Add delay to respect API rate limits
-                    if self.grok_service and i % 10 == 0:  # Every 10 requests
-                        logger.info("Rate limiting pause...")
-                        time.sleep(2)
+                        logger.info("✓ Updated: %s%s", deputy.nome_parlamentar, review_status)
                         
                 except Exception as e:
                     deputy_name = deputy_data.get('nome', 'Unknown') if deputy_data else 'Unknown'
-                    logger.error(f"✗ Error processing deputy {deputy_name}: {str(e)}")
+                    logger.error("✗ Error processing deputy %s: %s", deputy_name, e)
                     continue
+            
+            Deputado.objects.bulk_create(new_deputies, batch_size=BULK_BATCH_SIZE)
+            Deputado.objects.bulk_update(
+                changed_deputies.values(), DEPUTY_UPDATE_FIELDS, batch_size=BULK_BATCH_SIZE
+            )
+            if skipped_api_ids:
+                Deputado.objects.filter(api_id__in=skipped_api_ids).update(is_active=True, updated_at=now)
+        
+        # Bulk writes send no signals, so the admin's cached party choices are dropped here
+        clear_partido_choices(Deputado)
         
         if skip_existing:
-            logger.info(f"\nExtraction completed: {created_count} created, {updated_count} updated, {skipped_count} skipped (already existed)")
+            logger.info("\nExtraction completed: %s created, %s updated, %s skipped (already existed)", created_count, updated_count, skipped_count)
         else:
-            logger.info(f"\nExtraction completed: {created_count} created, {updated_count} updated")
+            logger.info("\nExtraction completed: %s created, %s updated", created_count, updated_count)
         logger.info("New Grok-enhanced extraction flow completed successfully!")
         return created_count, updated_count
\ No newline at end of file
@@ -4,19 +4,64 @@ Handles Twitter profile discovery using Grok API with live search
 """
 
 import requests
+import hashlib
+import json
 import logging
+import threading
+import time
 from typing import Dict, List, Optional
 from django.conf import settings
+from django.core.cache import caches
 import re
 
+from .http_cache import HTTP_CACHE_ALIAS
+
 logger = logging.getLogger(__name__)
 
+# Sustained Grok request rate and the burst allowed on top of it
+GROK_REQUESTS_PER_SECOND = 2
+GROK_REQUEST_BURST = 10
+
+# Grok answers for the same search are reused across extractor runs for a week
+GROK_PROFILE_MAX_AGE = 60 * 60 * 24 * 7
+
+# Distinguishes a cache miss from a cached "not found" answer (None)
+_CACHE_MISS = object()
+
 
 class GrokAPIError(Exception):
     """Custom exception for Grok API errors"""
     pass
 
 
+class RateLimiter:
+    """
+    Thread-safe token bucket: allows bursts of up to `capacity` requests and
+    refills at `rate` requests per second, blocking callers only when empty
+    """
+    
+    def __init__(self, rate: float, capacity: int):
+        self.rate = rate
+        self.capacity = capacity
+        self.tokens = float(capacity)
+        self.updated_at = time.monotonic()
+        self.lock = threading.Lock()
+    
+    def acquire(self):
+        with self.lock:
+            now = time.monotonic()
+            self.tokens = min(self.capacity, self.tokens + (now - self.updated_at) * self.rate)
+            self.updated_at = now
+            
+            if self.tokens < 1:
+                wait = (1 - self.tokens) / self.rate
+                time.sleep(wait)
+                self.tokens = 1.0
+                self.updated_at = time.monotonic()
+            
+            self.tokens -= 1
+
+
 class GrokTwitterService:
     """
     Service class for Twitter/X profile discovery using Grok API
@@ -40,6 +85,7 @@ class GrokTwitterService:
         self.session.headers.update(self.base_headers)
         
         # Rate limiting and retry configuration
+        self.rate_limiter = RateLimiter(GROK_REQUESTS_PER_SECOND, GROK_REQUEST_BURST)
         self.max_retries = 3
         self.retry_delay = 2  # Base for exponential backoff
     
@@ -60,6 +106,7 @@ class GrokTwitterService:
         """
         for attempt in range(self.max_retries):
             try:
+                self.rate_limiter.acquire()
                 response = self.session.request(method, url, **kwargs)
                 
                 # Handle different response codes
@@ -70,16 +117,18 @@ class GrokTwitterService:
                 elif response.status_code == 403:
                     raise GrokAPIError("Access forbidden - check API permissions")
                 elif response.status_code == 429:
-                    # Rate limited - wait and retry with exponential backoff
+                    # Rate limited - wait as instructed by the server, or back off exponentially
                     if attempt < self.max_retries - 1:
-                        import time
-                        time.sleep(self.retry_delay ** (attempt + 1))  # 2, 4, 8 seconds
+                        retry_after = response.headers.get('Retry-After', '')
+                        if retry_after.isdigit():
+                            time.sleep(int(retry_after))
+                        else:
+                            time.sleep(self.retry_delay ** (attempt + 1))  # 2, 4, 8 seconds
                         continue
                     raise GrokAPIError("Rate limit exceeded - please try again later")
                 elif response.status_code >= 500:
                     # Server error - retry with exponential backoff
                     if attempt < self.max_retries - 1:
-                        import time
                         time.sleep(self.retry_delay ** (attempt + 1))  # 2, 4, 8 seconds
                         continue
                     raise GrokAPIError(f"Server error: {response.status_code}")
@@ -88,7 +137,6 @@ class GrokTwitterService:
                     
             except requests.RequestException as e:
                 if attempt < self.max_retries - 1:
-                    import time
                     time.sleep(self.retry_delay * (attempt + 1))
                     continue
                 raise GrokAPIError(f"Request failed: {str(e)}")
@@ -131,7 +179,14 @@ class GrokTwitterService:
             
             query = " ".join(search_terms)
             
-            logger.info(f"Searching for Twitter profile via Grok with live search: {query}")
+            cache = caches[HTTP_CACHE_ALIAS]
+            cache_key = f"grok_profile:{hashlib.md5(query.encode()).hexdigest()}"
+            cached_profile = cache.get(cache_key, _CACHE_MISS)
+            if cached_profile is not _CACHE_MISS:
+                logger.debug("Using cached Grok answer for %s", nome_parlamentar)
+                return cached_profile
+            
+            logger.debug("Searching for Twitter profile via Grok with live search: %s", query)
             
             # Real Grok API call for Twitter profile search
             try:
@@ -200,13 +255,13 @@ Se não encontrado, use {{"status": "not_found", "results": []}}."""
                 }
                 
                 # Make API call with live search enabled
-                logger.info("Making Grok API call with live search enabled...")
+                logger.debug("Making Grok API call with live search enabled...")
                 response = self._make_request('POST', 'https://api.x.ai/v1/chat/completions', json=api_payload)
                 
                 # Parse the response to extract JSON from Grok's response
                 content = response.get('choices', [{}])[0].get('message', {}).get('content', '')
                 
-                logger.info(f"Grok profile response: {content}")
+                logger.debug("Grok profile response: %s", content)
                 
                 # Check if response is empty or just whitespace
                 if not content or not content.strip():
@@ -214,9 +269,6 @@ Se não encontrado, use {{"status": "not_found", "results": []}}."""
                     raise ValueError("Empty response from Grok API")
                 
                 # Enhanced JSON parsing with XML tag handling
-                import json
-                import re
-                
                 # Strip XML tags or markdown
                 content = content.strip()
                 if content.startswith('<json>') and content.endswith('</json>'):
@@ -226,16 +278,16 @@ Se não encontrado, use {{"status": "not_found", "results": []}}."""
                 
                 try:
                     parsed_json = json.loads(content)
-                    logger.info(f"Parsed JSON: {parsed_json}")
+                    logger.debug("Parsed JSON: %s", parsed_json)
                 except json.JSONDecodeError:
                     # Fallback to regex extraction
                     json_match = re.search(r'\{.*\}', content, re.DOTALL)
                     if json_match:
                         try:
                             parsed_json = json.loads(json_match.group())
-                            logger.info(f"Parsed JSON via regex: {parsed_json}")
+                            logger.debug("Parsed JSON via regex: %s", parsed_json)
                         except json.JSONDecodeError as e:
-                            logger.error(f"Failed to parse JSON from Grok response: {e}")
+                            logger.error("Failed to parse JSON from Grok response: %s", e)
                             raise ValueError(f"Invalid JSON in Grok response: {e}")
                     else:
                         raise ValueError("No valid JSON found in Grok response")
@@ -273,13 +325,14 @@ Se não encontrado, use {{"status": "not_found", "results": []}}."""
                 logger.error("Failed to connect to Grok API")
                 api_response = {"status": "connection_error", "results": []}
             except GrokAPIError as e:
-                logger.error(f"Grok API error (check live search permissions): {str(e)}")
+                logger.error("Grok API error (check live search permissions): %s", e)
                 api_response = {"status": "api_error", "results": []}
             except Exception as e:
-                logger.error(f"Unexpected error in profile search with live search: {str(e)}")
+                logger.error("Unexpected error in profile search with live search: %s", e)
                 api_response = {"status": "error", "results": []}
             
             # Process Grok response
+            profile_info = None
             if api_response.get("status") == "success" and api_response.get("results"):
                 results = api_response["results"]
                 
@@ -315,17 +368,21 @@ Se não encontrado, use {{"status": "not_found", "results": []}}."""
                         }
                     }
                     
-                    logger.info(f"Found Twitter profile via Grok: {profile_info['url']} (confidence: {profile_info['confidence_score']})")
-                    return profile_info
+                    logger.debug("Found Twitter profile via Grok: %s (confidence: %s)", profile_info['url'], profile_info['confidence_score'])
             
-            logger.info(f"No Twitter profile found via Grok for {nome_parlamentar}")
-            return None
+            if profile_info is None:
+                logger.debug("No Twitter profile found via Grok for %s", nome_parlamentar)
+            
+            # Only actual answers are cached; timeouts and API errors are retried on the next run
+            if api_response.get("status") in ("success", "not_found"):
+                cache.set(cache_key, profile_info, GROK_PROFILE_MAX_AGE)
+            return profile_info
             
         except GrokAPIError as e:
-            logger.error(f"Grok API error finding Twitter profile for {nome_parlamentar}: {str(e)}")
+            logger.error("Grok API error finding Twitter profile for %s: %s", nome_parlamentar, e)
             return None
         except Exception as e:
-            logger.error(f"Unexpected error finding Twitter profile for {nome_parlamentar}: {str(e)}")
+            logger.error("Unexpected error finding Twitter profile for %s: %s", nome_parlamentar, e)
             return None
     
     def verify_profile_authenticity(self, profile_url: str, nome: str, nome_parlamentar: str) -> Dict[str, any]:
@@ -341,7 +398,7 @@ Se não encontrado, use {{"status": "not_found", "results": []}}."""
             Dictionary with verification results
         """
         try:
-            logger.info(f"Verifying profile authenticity via Grok: {profile_url}")
+            logger.debug("Verifying profile authenticity via Grok: %s", profile_url)
             
             # Real Grok API call for verification
             system_message = """You are an authenticity verifier for X profiles of Brazilian politicians. Analyze the profile and return ONLY JSON with verification details."""
@@ -382,14 +439,13 @@ Responda APENAS com JSON:
             if content.startswith('<json>') and content.endswith('</json>'):
                 content = content.replace('<json>', '').replace('</json>', '').strip()
             
-            import json
             verification_result = json.loads(content)
             
-            logger.info(f"Profile verification complete: {verification_result['confidence_score']} confidence")
+            logger.debug("Profile verification complete: %s confidence", verification_result['confidence_score'])
             return verification_result
             
         except Exception as e:
-            logger.error(f"Error verifying profile authenticity: {str(e)}")
+            logger.error("Error verifying profile authenticity: %s", e)
             return {
                 'is_authentic': False,
                 'confidence_score': 0.0,
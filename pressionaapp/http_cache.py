@@ -0,0 +1,68 @@
+"""
+Conditional-GET cache for the congress data extractors
+Keeps responses from the Chamber and Senate sites between runs so unchanged
+resources are revalidated with ETag/Last-Modified instead of re-downloaded
+"""
+
+import hashlib
+import logging
+import time
+from typing import Dict, Optional
+
+import requests
+from django.core.cache import caches
+
+logger = logging.getLogger(__name__)
+
+HTTP_CACHE_ALIAS = 'http'
+
+# 404s are cached too so missing resources are not probed again on every run
+CACHEABLE_STATUS_CODES = (200, 404)
+
+
+def cached_get(session: requests.Session, url: str, params: Optional[Dict] = None,
+               timeout: Optional[float] = None, max_age: Optional[int] = None) -> requests.Response:
+    """
+    GET a URL through the on-disk HTTP cache
+
+    Args:
+        session: Session used for the network request
+        url: URL to fetch
+        params: Optional query string parameters
+        timeout: Request timeout in seconds
+        max_age: Seconds a cached copy is served without contacting the server,
+                 for resources that send no validators
+
+    Returns:
+        The live response, or the cached one (possibly a cached 404) when it is
+        still fresh or the server answers 304 Not Modified
+    """
+    cache = caches[HTTP_CACHE_ALIAS]
+    full_url = requests.Request('GET', url, params=params).prepare().url
+    cache_key = f"http_cache:{hashlib.md5(full_url.encode()).hexdigest()}"
+
+    entry = cache.get(cache_key)
+    headers = {}
+    if entry is not None:
+        cached_response = entry['response']
+        if max_age is not None and time.time() - entry['fetched_at'] < max_age:
+            return cached_response
+
+        if cached_response.headers.get('ETag'):
+            headers['If-None-Match'] = cached_response.headers['ETag']
+        if cached_response.headers.get('Last-Modified'):
+            headers['If-Modified-Since'] = cached_response.headers['Last-Modified']
+
+    response = session.get(full_url, headers=headers, timeout=timeout)
+
+    if response.status_code == 304 and entry is not None:
+        logger.debug(f"Not modified, using cached copy of {full_url}")
+        entry['fetched_at'] = time.time()
+        cache.set(cache_key, entry)
+        return entry['response']
+
+    has_validators = 'ETag' in response.headers or 'Last-Modified' in response.headers
+    if response.status_code in CACHEABLE_STATUS_CODES and (has_validators or max_age is not None):
+        cache.set(cache_key, {'response': response, 'fetched_at': time.time()})
+
+    return response
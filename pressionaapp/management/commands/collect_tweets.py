@@ -18,6 +18,24 @@ from selenium.webdriver.chrome.service import Service
 from selenium.common.exceptions import TimeoutException, NoSuchElementException
 from webdriver_manager.chrome import ChromeDriverManager
 from pressionaapp.models import Deputado, Senador, Tweet
+from pressionaapp.twitter_utils import TWEET_ID_RE, TWITTER_URL_RE
+
+# Engagement counts in a metric button's aria-label, e.g. "1234 Likes. Like"
+METRIC_COUNT_RE = re.compile(r'\d+')
+
+# Collects the fields extract_tweet_data needs from a tweet element (arguments[0])
+TWEET_FIELDS_SCRIPT = """
+const tweet = arguments[0];
+const text = tweet.querySelector('[data-testid="tweetText"]');
+const time = tweet.querySelector('time');
+const link = tweet.querySelector('a[href*="/status/"]');
+return {
+    text: text ? text.innerText : '',
+    date: time ? time.getAttribute('datetime') || '' : '',
+    url: link ? link.href : '',
+    metric_labels: Array.from(tweet.querySelectorAll('[role="button"]'), button => button.getAttribute('aria-label') || ''),
+};
+"""
 
 
 class TwitterProfileTweetCollector:
@@ -37,6 +55,10 @@ class TwitterProfileTweetCollector:
         chrome_options.add_argument("--disable-blink-features=AutomationControlled")
         chrome_options.add_experimental_option("excludeSwitches", ["enable-automation"])
         chrome_options.add_experimental_option('useAutomationExtension', False)
+        # Only tweet text, dates and links are read, so skip downloading avatars and media
+        chrome_options.add_experimental_option('prefs', {'profile.managed_default_content_settings.images': 2})
+        # Return from get() once the DOM is ready; tweets are awaited explicitly afterwards
+        chrome_options.page_load_strategy = 'eager'
         
         try:
             # Automatically download and setup ChromeDriver
@@ -169,19 +191,9 @@ class TwitterProfileTweetCollector:
         if not twitter_url:
             return None
         
-        # Remove protocol and domain
-        username = twitter_url.replace('https://', '').replace('http://', '')
-        username = username.replace('x.com/', '').replace('twitter.com/', '')
-        
-        # Remove any path after username
-        if '/' in username:
-            username = username.split('/')[0]
-        
-        # Remove query parameters
-        if '?' in username:
-            username = username.split('?')[0]
-        
-        return username.strip()
+        # Protocol, www, @, path and query string are all skipped by the pattern
+        match = TWITTER_URL_RE.search(twitter_url)
+        return match.group(1) if match else twitter_url.strip()
     
     def visit_profile_and_get_latest_tweet(self, politician):
         """Visit politician's profile and get their latest tweet"""
@@ -197,38 +209,15 @@ class TwitterProfileTweetCollector:
             self.stdout.write(f"📱 Visiting: {profile_url}")
             self.driver.get(profile_url)
             
-            # Wait for page to load
-            time.sleep(4)
-            
-            # Check if profile is accessible
-            page_source = self.driver.page_source.lower()
-            
-            # Check for suspension or not found
-            if any(indicator in page_source for indicator in [
-                "account suspended", "this account has been suspended",
-                "this account doesn't exist", "sorry, that page doesn't exist"
-            ]):
-                self.stdout.write("❌ Profile suspended or not found")
-                return self.create_result_entry(politician, "suspended", None)
-            
-            self.stdout.write("✅ Profile accessible")
-            
             # Try to find the latest tweet
             try:
-                # Wait for tweets to load
-                WebDriverWait(self.driver, 10).until(
+                # Wait for the first tweet (most recent) instead of pausing for a fixed time;
+                # the page source is only inspected when no tweet shows up
+                first_tweet = WebDriverWait(self.driver, 10).until(
                     EC.presence_of_element_located((By.CSS_SELECTOR, '[data-testid="tweet"]'))
                 )
                 
-                # Find the first tweet (most recent)
-                tweet_elements = self.driver.find_elements(By.CSS_SELECTOR, '[data-testid="tweet"]')
-                
-                if not tweet_elements:
-                    self.stdout.write("❌ No tweets found")
-                    return self.create_result_entry(politician, "no_tweets", None)
-                
-                # Get the first tweet (most recent)
-                first_tweet = tweet_elements[0]
+                self.stdout.write("✅ Profile accessible")
                 
                 # Extract tweet data
                 tweet_data = self.extract_tweet_data(first_tweet, username)
@@ -253,6 +242,15 @@ class TwitterProfileTweetCollector:
                     return self.create_result_entry(politician, "extraction_failed", None)
                 
             except TimeoutException:
+                # Check for suspension or not found
+                page_source = self.driver.page_source.lower()
+                if any(indicator in page_source for indicator in [
+                    "account suspended", "this account has been suspended",
+                    "this account doesn't exist", "sorry, that page doesn't exist"
+                ]):
+                    self.stdout.write("❌ Profile suspended or not found")
+                    return self.create_result_entry(politician, "suspended", None)
+                
                 self.stdout.write("❌ Timeout waiting for tweets to load")
                 return self.create_result_entry(politician, "timeout", None)
             
@@ -273,57 +271,29 @@ class TwitterProfileTweetCollector:
                 'replies': 0
             }
             
-            # Extract tweet text
-            try:
-                text_elements = tweet_element.find_elements(By.CSS_SELECTOR, '[data-testid="tweetText"]')
-                if text_elements:
-                    tweet_data['text'] = text_elements[0].text
-            except:
-                pass
-            
-            # Extract tweet date/time
-            try:
-                time_elements = tweet_element.find_elements(By.TAG_NAME, "time")
-                if time_elements:
-                    tweet_data['date'] = time_elements[0].get_attribute("datetime")
-            except:
-                pass
-            
-            # Extract tweet URL
-            try:
-                link_elements = tweet_element.find_elements(By.CSS_SELECTOR, 'a[href*="/status/"]')
-                if link_elements:
-                    href = link_elements[0].get_attribute('href')
-                    if href:
-                        tweet_data['url'] = href
-            except:
-                pass
+            # Read text, date, URL and the metric buttons' labels in a single WebDriver round trip
+            fields = self.driver.execute_script(TWEET_FIELDS_SCRIPT, tweet_element)
+            tweet_data['text'] = fields['text']
+            tweet_data['date'] = fields['date']
+            tweet_data['url'] = fields['url']
             
             # Extract engagement metrics (likes, retweets, replies)
-            try:
-                # Try to find metric buttons
-                metric_buttons = tweet_element.find_elements(By.CSS_SELECTOR, '[role="button"]')
-                for button in metric_buttons:
-                    aria_label = button.get_attribute('aria-label') or ''
-                    
-                    if 'like' in aria_label.lower():
-                        # Extract number from aria-label
-                        import re
-                        numbers = re.findall(r'\\d+', aria_label.replace(',', ''))
-                        if numbers:
-                            tweet_data['likes'] = int(numbers[0])
-                    
-                    elif 'repost' in aria_label.lower() or 'retweet' in aria_label.lower():
-                        numbers = re.findall(r'\\d+', aria_label.replace(',', ''))
-                        if numbers:
-                            tweet_data['retweets'] = int(numbers[0])
-                    
-                    elif 'repl' in aria_label.lower():
-                        numbers = re.findall(r'\\d+', aria_label.replace(',', ''))
-                        if numbers:
-                            tweet_data['replies'] = int(numbers[0])
-            except:
-                pass
+            for aria_label in fields['metric_labels']:
+                label_lower = aria_label.lower()
+                
+                if 'like' in label_lower:
+                    metric = 'likes'
+                elif 'repost' in label_lower or 'retweet' in label_lower:
+                    metric = 'retweets'
+                elif 'repl' in label_lower:
+                    metric = 'replies'
+                else:
+                    continue
+                
+                # Extract number from aria-label
+                numbers = METRIC_COUNT_RE.findall(aria_label.replace(',', ''))
+                if numbers:
+                    tweet_data[metric] = int(numbers[0])
             
             return tweet_data
             
@@ -441,7 +411,7 @@ class TwitterProfileTweetCollector:
             return None
         
         # Pattern to match Twitter status URLs
-        match = re.search(r'/status/(\d+)', tweet_url)
+        match = TWEET_ID_RE.search(tweet_url)
         return match.group(1) if match else None
     
     def run_collection(self, limit=None, politicians_type='both'):
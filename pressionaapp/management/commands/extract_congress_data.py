@@ -56,11 +56,14 @@ class Command(BaseCommand):
             
             try:
                 extractor = DeputadosDataExtractor()
-                created, updated = extractor.extract_deputies(
-                    update_existing=update_existing,
-                    limit=options.get('limit'),
-                    skip_existing=skip_existing
-                )
+                try:
+                    created, updated = extractor.extract_deputies(
+                        update_existing=update_existing,
+                        limit=options.get('limit'),
+                        skip_existing=skip_existing
+                    )
+                finally:
+                    extractor.close()
                 self.stdout.write(f"✅ Deputies: {created} created, {updated} updated")
             except Exception as e:
                 self.stdout.write(f"❌ Error extracting deputies: {str(e)}")
@@ -75,10 +78,13 @@ class Command(BaseCommand):
             
             try:
                 extractor = SenadoresDataExtractor()
-                created, updated = extractor.extract_senators(
-                    limit=options.get('limit'),
-                    update_existing=update_existing
-                )
+                try:
+                    created, updated = extractor.extract_senators(
+                        limit=options.get('limit'),
+                        update_existing=update_existing
+                    )
+                finally:
+                    extractor.close()
                 self.stdout.write(f"✅ Senators: {created} created, {updated} updated")
             except Exception as e:
                 self.stdout.write(f"❌ Error extracting senators: {str(e)}")
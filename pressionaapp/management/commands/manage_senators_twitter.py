@@ -3,6 +3,15 @@ from pressionaapp.models import Senador
 import json
 import re
 
+# A full twitter.com/x.com profile URL or a bare @handle
+VALID_TWITTER_URL_RE = re.compile(
+    r'(?:https?://(?:www\.)?(?:twitter\.com|x\.com)/[a-zA-Z0-9_]+/?|@[a-zA-Z0-9_]+)$',
+    re.IGNORECASE
+)
+
+# Handle in a twitter.com/x.com URL
+TWITTER_HANDLE_RE = re.compile(r'(?:twitter\.com|x\.com)/([a-zA-Z0-9_]+)')
+
 
 class Command(BaseCommand):
     help = 'Manually add Twitter accounts for senators and export to JSON'
@@ -147,12 +156,7 @@ class Command(BaseCommand):
 
     def is_valid_twitter_url(self, url):
         """Validate Twitter URL format"""
-        patterns = [
-            r'https?://(www\.)?(twitter\.com|x\.com)/[a-zA-Z0-9_]+/?$',
-            r'@[a-zA-Z0-9_]+$',  # Just handle
-        ]
-        
-        return any(re.match(pattern, url, re.IGNORECASE) for pattern in patterns)
+        return VALID_TWITTER_URL_RE.match(url) is not None
 
     def normalize_twitter_url(self, url):
         """Normalize Twitter URL to standard format"""
@@ -177,5 +181,5 @@ class Command(BaseCommand):
         if not url:
             return None
             
-        match = re.search(r'(?:twitter\.com|x\.com)/([a-zA-Z0-9_]+)', url)
+        match = TWITTER_HANDLE_RE.search(url)
         return match.group(1) if match else None
\ No newline at end of file
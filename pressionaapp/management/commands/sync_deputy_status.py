@@ -28,7 +28,7 @@ class Command(BaseCommand):
             response.raise_for_status()
             
             api_data = response.json()
-            current_api_ids = {str(dep['id']) for dep in api_data['dados']}
+            current_api_ids = {dep['id'] for dep in api_data['dados']}
             
             self.stdout.write(f"✅ Found {len(current_api_ids)} active deputies in official API")
             
@@ -64,10 +64,13 @@ class Command(BaseCommand):
             if options['dry_run']:
                 self.stdout.write("\n🔍 DRY RUN - No changes will be made")
                 
+                # Load the listed records in one query instead of one get() per row
+                shown_deputies = Deputado.objects.in_bulk(will_activate[:10] + will_deactivate[:10], field_name='api_id')
+                
                 if will_activate:
                     self.stdout.write(f"\nWould ACTIVATE {len(will_activate)} deputies:")
                     for api_id in will_activate[:10]:  # Show first 10
-                        deputy = Deputado.objects.get(api_id=api_id)
+                        deputy = shown_deputies[api_id]
                         self.stdout.write(f"   ✅ {deputy.nome_parlamentar} (ID: {api_id})")
                     if len(will_activate) > 10:
                         self.stdout.write(f"   ... and {len(will_activate) - 10} more")
@@ -75,7 +78,7 @@ class Command(BaseCommand):
                 if will_deactivate:
                     self.stdout.write(f"\nWould DEACTIVATE {len(will_deactivate)} deputies:")
                     for api_id in will_deactivate[:10]:  # Show first 10
-                        deputy = Deputado.objects.get(api_id=api_id)
+                        deputy = shown_deputies[api_id]
                         self.stdout.write(f"   ❌ {deputy.nome_parlamentar} (ID: {api_id})")
                     if len(will_deactivate) > 10:
                         self.stdout.write(f"   ... and {len(will_deactivate) - 10} more")
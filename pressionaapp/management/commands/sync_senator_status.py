@@ -85,10 +85,13 @@ class Command(BaseCommand):
             if options['dry_run']:
                 self.stdout.write("\n🔍 DRY RUN - No changes will be made")
                 
+                # Load the listed records in one query instead of one get() per row
+                shown_senators = Senador.objects.in_bulk(will_activate[:10] + will_deactivate[:10], field_name='api_id')
+                
                 if will_activate:
                     self.stdout.write(f"\nWould ACTIVATE {len(will_activate)} senators:")
                     for api_id in will_activate[:10]:  # Show first 10
-                        senator = Senador.objects.get(api_id=api_id)
+                        senator = shown_senators[int(api_id)]
                         self.stdout.write(f"   ✅ {senator.nome_parlamentar} (ID: {api_id})")
                     if len(will_activate) > 10:
                         self.stdout.write(f"   ... and {len(will_activate) - 10} more")
@@ -96,7 +99,7 @@ class Command(BaseCommand):
                 if will_deactivate:
                     self.stdout.write(f"\nWould DEACTIVATE {len(will_deactivate)} senators:")
                     for api_id in will_deactivate[:10]:  # Show first 10
-                        senator = Senador.objects.get(api_id=api_id)
+                        senator = shown_senators[int(api_id)]
                         self.stdout.write(f"   ❌ {senator.nome_parlamentar} (ID: {api_id})")
                     if len(will_deactivate) > 10:
                         self.stdout.write(f"   ... and {len(will_deactivate) - 10} more")
@@ -4,7 +4,7 @@ Cloudflare Turnstile middleware for bot protection
 import logging
 from django.shortcuts import render
 from django.http import HttpResponseForbidden
-from django.urls import reverse
+from django.urls import resolve, reverse
 from django.conf import settings
 from .turnstile_utils import should_verify_turnstile
 
@@ -71,7 +71,6 @@ class TurnstileMiddleware:
         
         # Check URL names
         try:
-            from django.urls import resolve
             resolved = resolve(path)
             url_name = resolved.url_name
             
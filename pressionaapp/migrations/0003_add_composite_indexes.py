@@ -0,0 +1,37 @@
+# Generated by Django 5.2.18 on 2026-10-16 04:36
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('pressionaapp', '0002_add_choices_to_social_media_fields'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='deputado',
+            index=models.Index(fields=['is_active', 'uf', 'partido'], name='pressionaap_is_acti_90f7d1_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='deputado',
+            index=models.Index(fields=['needs_social_media_review', 'social_media_confidence'], name='pressionaap_needs_s_8f357b_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='deputado',
+            index=models.Index(fields=['-created_at'], name='pressionaap_created_60201b_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='senador',
+            index=models.Index(fields=['is_active', 'uf', 'partido'], name='pressionaap_is_acti_418b05_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='senador',
+            index=models.Index(fields=['needs_social_media_review', 'social_media_confidence'], name='pressionaap_needs_s_84601c_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='senador',
+            index=models.Index(fields=['-created_at'], name='pressionaap_created_30a8bc_idx'),
+        ),
+    ]
@@ -3,6 +3,9 @@ from django.contrib.auth.models import User
 from django.utils import timezone
 from django.contrib.contenttypes.models import ContentType
 from django.contrib.contenttypes.fields import GenericForeignKey
+from urllib.parse import quote
+
+from .twitter_utils import TWEET_ID_RE
 
 
 class Tweet(models.Model):
@@ -61,7 +64,6 @@ class Tweet(models.Model):
             parliamentarian_name = getattr(self.parliamentarian, 'nome_parlamentar', 'Parlamentar')
             message = f"Olá {parliamentarian_name}! Gostaria de dialogar sobre suas propostas. #TransparênciaPolítica"
         
-        from urllib.parse import quote
         encoded_message = quote(message)
         return f"https://twitter.com/intent/tweet?in_reply_to={self.tweet_id}&text={encoded_message}"
 
@@ -292,6 +294,10 @@ class Deputado(models.Model):
             models.Index(fields=['uf']),
             models.Index(fields=['nome_parlamentar']),
             models.Index(fields=['is_active']),
+            # Composite indexes for the admin changelist filter combinations
+            models.Index(fields=['is_active', 'uf', 'partido']),
+            models.Index(fields=['needs_social_media_review', 'social_media_confidence']),
+            models.Index(fields=['-created_at']),
         ]
     
     def __str__(self):
@@ -312,11 +318,8 @@ class Deputado(models.Model):
         if not self.latest_tweet_url:
             return None
             
-        import re
-        from urllib.parse import quote
-        
         # Extract tweet ID
-        tweet_id_match = re.search(r'/status/(\d+)', self.latest_tweet_url)
+        tweet_id_match = TWEET_ID_RE.search(self.latest_tweet_url)
         if not tweet_id_match:
             return None
             
@@ -331,7 +334,6 @@ class Deputado(models.Model):
     
     def get_tweets(self):
         """Get all tweets for this deputy ordered by position"""
-        from django.contrib.contenttypes.models import ContentType
         ct = ContentType.objects.get_for_model(self)
         return Tweet.objects.filter(content_type=ct, object_id=self.id, is_active=True).order_by('position')
     
@@ -342,9 +344,6 @@ class Deputado(models.Model):
     
     def update_tweets(self, tweet_data):
         """Update the 5 latest tweets for this deputy"""
-        from django.contrib.contenttypes.models import ContentType
-        import re
-        
         ct = ContentType.objects.get_for_model(self)
         
         # Clear existing tweets
@@ -370,7 +369,7 @@ class Deputado(models.Model):
                 continue
                 
             # Extract tweet ID from URL
-            tweet_id_match = re.search(r'/status/(\d+)', tweet_url)
+            tweet_id_match = TWEET_ID_RE.search(tweet_url)
             tweet_id = tweet_id_match.group(1) if tweet_id_match else str(position)
             
             Tweet.objects.create(
@@ -461,6 +460,10 @@ class Senador(models.Model):
             models.Index(fields=['uf']),
             models.Index(fields=['nome_parlamentar']),
             models.Index(fields=['is_active']),
+            # Composite indexes for the admin changelist filter combinations
+            models.Index(fields=['is_active', 'uf', 'partido']),
+            models.Index(fields=['needs_social_media_review', 'social_media_confidence']),
+            models.Index(fields=['-created_at']),
         ]
     
     def __str__(self):
@@ -481,11 +484,8 @@ class Senador(models.Model):
         if not self.latest_tweet_url:
             return None
             
-        import re
-        from urllib.parse import quote
-        
         # Extract tweet ID
-        tweet_id_match = re.search(r'/status/(\d+)', self.latest_tweet_url)
+        tweet_id_match = TWEET_ID_RE.search(self.latest_tweet_url)
         if not tweet_id_match:
             return None
             
@@ -500,7 +500,6 @@ class Senador(models.Model):
     
     def get_tweets(self):
         """Get all tweets for this senator ordered by position"""
-        from django.contrib.contenttypes.models import ContentType
         ct = ContentType.objects.get_for_model(self)
         return Tweet.objects.filter(content_type=ct, object_id=self.id, is_active=True).order_by('position')
     
@@ -511,9 +510,6 @@ class Senador(models.Model):
     
     def update_tweets(self, tweet_data):
         """Update the 5 latest tweets for this senator"""
-        from django.contrib.contenttypes.models import ContentType
-        import re
-        
         ct = ContentType.objects.get_for_model(self)
         
         # Clear existing tweets
@@ -539,7 +535,7 @@ class Senador(models.Model):
                 continue
                 
             # Extract tweet ID from URL
-            tweet_id_match = re.search(r'/status/(\d+)', tweet_url)
+            tweet_id_match = TWEET_ID_RE.search(tweet_url)
             tweet_id = tweet_id_match.group(1) if tweet_id_match else str(position)
             
             Tweet.objects.create(
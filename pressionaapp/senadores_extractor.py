@@ -10,20 +10,58 @@ import logging
 import xml.etree.ElementTree as ET
 from datetime import datetime
 from typing import Dict, List, Optional, Tuple, Any
-from urllib.parse import urljoin, urlparse
 
 import requests
-from bs4 import BeautifulSoup
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from bs4 import BeautifulSoup, SoupStrainer
 from django.db import transaction
+from django.utils import timezone
 from django.utils.dateparse import parse_date
 
 from .models import Senador
 from .grok_service import GrokTwitterService, GrokAPIError
+from .admin_cache import clear_partido_choices
+from .http_cache import cached_get
+from .twitter_utils import clean_twitter_url
 import re
-import time
 
 logger = logging.getLogger(__name__)
 
+# Rows per INSERT/UPDATE statement when saving extracted senators
+BULK_BATCH_SIZE = 200
+
+# Fields refreshed on existing senators by extract_senators
+SENATOR_UPDATE_FIELDS = [
+    'nome_parlamentar', 'partido', 'uf', 'email', 'telefone', 'foto_url',
+    'twitter_url', 'social_media_source', 'social_media_confidence',
+    'needs_social_media_review', 'is_active', 'updated_at',
+]
+
+# The senator profile pages send no cache validators; reuse a downloaded page for a day
+SENATE_PAGE_MAX_AGE = 60 * 60 * 24
+
+# CSS selector for Twitter/X links on a senator's profile page
+TWITTER_LINK_SELECTOR = 'a[href*="twitter.com"], a[href*="x.com"]'
+
+# Only Twitter/X anchors are built into a tree; the rest of the page is skipped
+TWITTER_LINK_STRAINER = SoupStrainer('a', href=re.compile(r'twitter\.com|x\.com'))
+
+# Official Senate identifiers (lowercase, matched against the lowercased URL)
+OFFICIAL_SENATE_PATTERNS = (
+    'senadofederal',
+    'senado.leg.br',
+    'senadodobrasil',
+    '@senadodobrasil',
+    '@senadofederal',
+    'senado.gov.br',
+    'senadofederal.gov.br',
+    'congressonacional',
+)
+
+# All official patterns folded into one alternation, so a URL is scanned once
+OFFICIAL_SENATE_RE = re.compile('|'.join(map(re.escape, OFFICIAL_SENATE_PATTERNS)))
+
 
 class SenadoresDataExtractor:
     """
@@ -39,31 +77,23 @@ class SenadoresDataExtractor:
             'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
         })
         
+        # Keep connections to the Senate hosts alive across senators and retry transient failures
+        adapter = HTTPAdapter(
+            max_retries=Retry(total=5, backoff_factor=0.3, status_forcelist=[429, 500, 502, 503, 504])
+        )
+        self.session.mount('https://', adapter)
+        
         # Initialize Grok service
         try:
             self.grok_service = GrokTwitterService()
             logger.info("Grok Twitter service initialized successfully for senators")
         except ValueError as e:
-            logger.error(f"Failed to initialize Grok service for senators: {e}")
+            logger.error("Failed to initialize Grok service for senators: %s", e)
             self.grok_service = None
     
-    def _clean_twitter_url(self, url: str) -> str:
-        """Clean Twitter URL to standardized format without @ or www"""
-        if not url:
-            return url
-            
-        import re
-        # Remove protocol, www, and extract clean username
-        pattern = r'(?:https?://)?(?:www\.)?(?:twitter\.com|x\.com)/(?:@)?(\w+)(?:\?.*)?(?:#.*)?'
-        match = re.match(pattern, url.strip())
-        
-        if match:
-            username = match.group(1)
-            # Return clean X.com URL format
-            return f"https://x.com/{username}"
-        
-        # If pattern doesn't match, return original URL
-        return url.strip()
+    def close(self):
+        """Release the pooled HTTP connections"""
+        self.session.close()
     
     def get_current_senators_list(self) -> List[Dict]:
         """
@@ -73,17 +103,17 @@ class SenadoresDataExtractor:
             List of dictionaries containing basic senator data
         """
         url = f"{self.base_url}/senador/lista/atual"
-        logger.info(f"Fetching senators list from: {url}")
+        logger.info("Fetching senators list from: %s", url)
         
         try:
-            response = self.session.get(url)
+            response = cached_get(self.session, url)
             response.raise_for_status()
             
             # Parse XML response
             root = ET.fromstring(response.content)
             senators = root.findall('.//Parlamentar')
             
-            logger.info(f"Encontrados {len(senators)} senadores ativos")
+            logger.info("Encontrados %s senadores ativos", len(senators))
             
             senators_data = []
             for senator_xml in senators:
@@ -94,10 +124,10 @@ class SenadoresDataExtractor:
             return senators_data
             
         except requests.RequestException as e:
-            logger.error(f"Erro ao buscar lista de senadores: {e}")
+            logger.error("Erro ao buscar lista de senadores: %s", e)
             return []
         except ET.ParseError as e:
-            logger.error(f"Erro ao parsing XML da lista de senadores: {e}")
+            logger.error("Erro ao parsing XML da lista de senadores: %s", e)
             return []
     
     def get_senator_details(self, senator_id: str) -> Optional[Dict]:
@@ -111,10 +141,10 @@ class SenadoresDataExtractor:
             Dictionary with detailed senator information
         """
         url = f"{self.base_url}/senador/{senator_id}"
-        logger.info(f"Buscando detalhes do senador {senator_id}")
+        logger.debug("Buscando detalhes do senador %s", senator_id)
         
         try:
-            response = self.session.get(url)
+            response = cached_get(self.session, url)
             response.raise_for_status()
             
             # Parse XML response
@@ -122,16 +152,16 @@ class SenadoresDataExtractor:
             parlamentar = root.find('.//Parlamentar')
             
             if parlamentar is None:
-                logger.warning(f"Parlamentar não encontrado no XML para senador {senator_id}")
+                logger.warning("Parlamentar não encontrado no XML para senador %s", senator_id)
                 return None
             
             return self._parse_detailed_senator_xml(parlamentar)
             
         except requests.RequestException as e:
-            logger.error(f"Erro ao buscar detalhes do senador {senator_id}: {e}")
+            logger.error("Erro ao buscar detalhes do senador %s: %s", senator_id, e)
             return None
         except ET.ParseError as e:
-            logger.error(f"Erro ao parsing XML dos detalhes do senador {senator_id}: {e}")
+            logger.error("Erro ao parsing XML dos detalhes do senador %s: %s", senator_id, e)
             return None
     
     def _parse_basic_senator_xml(self, senator_xml) -> Optional[Dict]:
@@ -177,7 +207,7 @@ class SenadoresDataExtractor:
             }
             
         except Exception as e:
-            logger.error(f"Erro ao parsing dados básicos do senador: {e}")
+            logger.error("Erro ao parsing dados básicos do senador: %s", e)
             return None
     
     def _parse_detailed_senator_xml(self, parlamentar_xml) -> Dict:
@@ -239,7 +269,7 @@ class SenadoresDataExtractor:
             }
             
         except Exception as e:
-            logger.error(f"Erro ao parsing dados detalhados do senador: {e}")
+            logger.error("Erro ao parsing dados detalhados do senador: %s", e)
             return {}
     
     def _get_xml_text(self, parent, tag_name: str) -> Optional[str]:
@@ -268,30 +298,20 @@ class SenadoresDataExtractor:
         if not url:
             return False
             
-        url_lower = url.lower()
-        
-        # List of official Senate identifiers
-        official_patterns = [
-            'senadofederal',
-            'senado.leg.br',
-            'senadodobrasil',
-            '@senadodobrasil',
-            '@senadofederal',
-            'senado.gov.br',
-            'senadofederal.gov.br',
-            'congressonacional',
-        ]
-        
-        return any(pattern.lower() in url_lower for pattern in official_patterns)
+        return OFFICIAL_SENATE_RE.search(url.lower()) is not None
     
     def extract_twitter_info(self, codigo_parlamentar: str, nome_completo: str = None, 
-                           nome_parlamentar: str = None, partido: str = None, uf: str = None) -> Dict[str, any]:
+                           nome_parlamentar: str = None, partido: str = None, uf: str = None,
+                           senator_details: Optional[Dict] = None) -> Dict[str, any]:
         """
         Extract Twitter account using the 3-step flow:
         1. Try Senate API (if available)
         2. Try Senate website scraping
         3. Try Grok API fallback (if no Twitter found)
         
+        Args:
+            senator_details: Details already fetched from the Senate API, to avoid fetching them again
+        
         Returns:
             Dictionary containing Twitter URL and metadata
         """
@@ -308,63 +328,47 @@ class SenadoresDataExtractor:
         
         # STEP 1: Try to get Twitter from official Senate API
         # Note: Senate API doesn't typically include social media like Chamber API
-        logger.info(f"Step 1: Checking Senate API for senator {codigo_parlamentar} ({nome_parlamentar})")
+        logger.debug("Step 1: Checking Senate API for senator %s (%s)", codigo_parlamentar, nome_parlamentar)
         try:
             # Senate API usually doesn't have social media fields, but check detailed info
-            senator_details = self.get_senator_details(codigo_parlamentar)
+            if senator_details is None:
+                senator_details = self.get_senator_details(codigo_parlamentar)
             # Most Senate API responses don't include social media, so this will typically be empty
             # But we keep this step for completeness and future API updates
             
         except Exception as e:
-            logger.warning(f"Error in Step 1 (Senate API): {str(e)}")
+            logger.warning("Error in Step 1 (Senate API): %s", e)
         
         # STEP 2: Try Senate website scraping
-        logger.info(f"Step 2: Scraping Senate website for senator {codigo_parlamentar}")
+        logger.debug("Step 2: Scraping Senate website for senator %s", codigo_parlamentar)
         try:
             # Senate profile URLs follow pattern: https://www25.senado.leg.br/web/senadores/senador/-/perfil/{codigo}
             url = f"https://www25.senado.leg.br/web/senadores/senador/-/perfil/{codigo_parlamentar}"
-            response = self.session.get(url, timeout=10)
+            response = cached_get(self.session, url, timeout=10, max_age=SENATE_PAGE_MAX_AGE)
             response.raise_for_status()
             
-            soup = BeautifulSoup(response.content, 'html.parser')
+            # lxml's C parser is much faster than html.parser and is already a requirement
+            soup = BeautifulSoup(response.content, 'lxml', parse_only=TWITTER_LINK_STRAINER)
             
-            # Look for social media links in the Senate website
-            # Check for Twitter links in various possible locations
-            twitter_links = soup.find_all('a', href=re.compile(r'(twitter\.com|x\.com)'))
-            
-            for link in twitter_links:
+            # Look for social media links in the Senate website; a single pass over every
+            # Twitter link on the page also covers links inside social media sections
+            for link in soup.select(TWITTER_LINK_SELECTOR):
                 href = link.get('href', '')
                 if not self._is_official_senate_link(href):
-                    result['twitter_url'] = self._clean_twitter_url(href)
+                    result['twitter_url'] = clean_twitter_url(href)
                     result['metadata']['source'] = 'senate_website'
                     result['metadata']['confidence'] = 'medium'
                     result['metadata']['details'] = 'Found Twitter link in Senate website'
                     result['metadata']['extraction_method'].append('senate_website_scraping')
-                    logger.info(f"✓ Found Twitter link: {result['twitter_url']}")
+                    logger.debug("✓ Found Twitter link: %s", result['twitter_url'])
                     break
-            
-            # Also check for social media sections or specific Twitter widgets
-            social_sections = soup.find_all(['div', 'section'], class_=re.compile(r'social|rede|twitter', re.I))
-            for section in social_sections:
-                if not result['twitter_url']:
-                    twitter_links = section.find_all('a', href=re.compile(r'(twitter\.com|x\.com)'))
-                    for link in twitter_links:
-                        href = link.get('href', '')
-                        if not self._is_official_senate_link(href):
-                            result['twitter_url'] = self._clean_twitter_url(href)
-                            result['metadata']['source'] = 'senate_website'
-                            result['metadata']['confidence'] = 'medium'
-                            result['metadata']['details'] = 'Found Twitter in social media section'
-                            result['metadata']['extraction_method'].append('senate_website_social')
-                            logger.info(f"✓ Found Twitter in social section: {result['twitter_url']}")
-                            break
-                            
+                    
         except Exception as e:
-            logger.warning(f"Error in Step 2 (Senate website): {str(e)}")
+            logger.warning("Error in Step 2 (Senate website): %s", e)
         
         # STEP 3: Use Grok API fallback if still no Twitter found
         if not result['twitter_url'] and self.grok_service:
-            logger.info(f"Step 3: Using Grok API fallback for senator {nome_parlamentar}")
+            logger.debug("Step 3: Using Grok API fallback for senator %s", nome_parlamentar)
             try:
                 # Build additional context for Grok search
                 additional_context = []
@@ -383,7 +387,7 @@ class SenadoresDataExtractor:
                 )
                 
                 if grok_profile:
-                    result['twitter_url'] = self._clean_twitter_url(grok_profile['url'])
+                    result['twitter_url'] = clean_twitter_url(grok_profile['url'])
                     result['metadata']['source'] = 'grok_api'
                     result['metadata']['confidence'] = 'medium' if grok_profile['confidence_score'] > 0.7 else 'low'
                     # Always set needs_review=True for Grok-discovered profiles for human verification
@@ -391,20 +395,21 @@ class SenadoresDataExtractor:
                     result['metadata']['details'] = f"Grok API found profile (confidence: {grok_profile['confidence_score']}) - marked for review"
                     result['metadata']['extraction_method'].append('grok_fallback')
                     result['metadata']['grok_profile_data'] = grok_profile
-                    logger.info(f"✓ Grok found Twitter: {result['twitter_url']} (confidence: {grok_profile['confidence_score']}) - MARKED FOR REVIEW")
+                    logger.info("✓ Grok found Twitter: %s (confidence: %s) - MARKED FOR REVIEW", result['twitter_url'], grok_profile['confidence_score'])
                     
             except Exception as e:
-                logger.warning(f"Error in Step 3 (Grok fallback): {str(e)}")
+                logger.warning("Error in Step 3 (Grok fallback): %s", e)
         
 
         
         # Log final result summary
         method_summary = " → ".join(result['metadata']['extraction_method'])
-        logger.info(f"Profile extraction complete for {nome_parlamentar}: {method_summary}")
-        logger.info(f"  Twitter URL: {'✓' if result['twitter_url'] else '✗'}")
-        logger.info(f"  Source: {result['metadata']['source']}")
-        logger.info(f"  Confidence: {result['metadata']['confidence']}")
-        logger.info(f"  Needs Review: {'✓ YES' if result['metadata']['needs_review'] else '✗ NO'} {'(Grok API discovery requires human verification)' if result['metadata']['source'] == 'grok_api' else ''}")
+        logger.info("Profile extraction complete for %s: %s", nome_parlamentar, method_summary)
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("  Twitter URL: %s", '✓' if result['twitter_url'] else '✗')
+            logger.debug("  Source: %s", result['metadata']['source'])
+            logger.debug("  Confidence: %s", result['metadata']['confidence'])
+            logger.debug("  Needs Review: %s %s", '✓ YES' if result['metadata']['needs_review'] else '✗ NO', '(Grok API discovery requires human verification)' if result['metadata']['source'] == 'grok_api' else '')
         
         return result
     
@@ -436,66 +441,103 @@ class SenadoresDataExtractor:
         # Apply limit if specified
         if limit:
             senators_data = senators_data[:limit]
-            logger.info(f"Processing limited to {limit} senators")
+            logger.info("Processing limited to %s senators", limit)
+        
+        api_ids = [int(d['codigo_parlamentar']) for d in senators_data
+                   if (d.get('codigo_parlamentar') or '').isdigit()]
+        
+        # Existing senators are only re-activated when not updating, so nothing is fetched for them
+        stored_api_ids = set()
+        if not update_existing:
+            stored_api_ids = set(Senador.objects.filter(api_id__in=api_ids).values_list('api_id', flat=True))
+        
+        # Details and Twitter discovery hit the Senate site and Grok, so they run before the transaction opens
+        senators_details = {}
+        extraction_results = {}
+        for senator_data in senators_data:
+            codigo_parlamentar = senator_data.get('codigo_parlamentar') or ''
+            if not codigo_parlamentar.isdigit() or int(codigo_parlamentar) in stored_api_ids:
+                continue
+            api_id = int(codigo_parlamentar)
+            
+            senators_details[api_id] = self.get_senator_details(codigo_parlamentar)
+            
+            # Extract Twitter info using new 4-step flow
+            extraction_results[api_id] = self.extract_twitter_info(
+                codigo_parlamentar=codigo_parlamentar,
+                nome_completo=senator_data.get('nome_completo', ''),
+                nome_parlamentar=senator_data.get('nome_parlamentar', ''),
+                partido=senator_data.get('partido', ''),
+                uf=senator_data.get('uf', ''),
+                senator_details=senators_details[api_id]
+            )
         
         with transaction.atomic():
             # First, mark all senators as inactive
             Senador.objects.all().update(is_active=False)
             
+            # Load the senators being processed in one query and write them back in bulk
+            existing_senators = Senador.objects.in_bulk(api_ids, field_name='api_id')
+            new_senators = []
+            changed_senators = {}
+            reactivated_api_ids = []
+            now = timezone.now()
+            
             for i, senator_data in enumerate(senators_data, 1):
                 try:
                     codigo_parlamentar = senator_data.get('codigo_parlamentar')
                     if not codigo_parlamentar:
                         continue
+                    api_id = int(codigo_parlamentar)
                     
-                    nome_completo = senator_data.get('nome_completo', '')
                     nome_parlamentar = senator_data.get('nome_parlamentar', '')
                     partido = senator_data.get('partido', '')
                     uf = senator_data.get('uf', '')
                     
-                    logger.info(f"\n[{i}/{len(senators_data)}] Processing: {nome_parlamentar} ({partido}-{uf})")
+                    logger.debug("\n[%s/%s] Processing: %s (%s-%s)", i, len(senators_data), nome_parlamentar, partido, uf)
+                    
+                    senator = existing_senators.get(api_id)
+                    
+                    if senator is not None and not update_existing:
+                        # Just mark as active; nothing was fetched for it
+                        reactivated_api_ids.append(api_id)
+                        continue
                     
                     # Get detailed senator information
-                    senator_details = self.get_senator_details(codigo_parlamentar)
+                    senator_details = senators_details.get(api_id)
                     telefone = None
                     if senator_details:
                         telefone = senator_details.get('telefone')
                     
-                    # Extract Twitter info using new 4-step flow
-                    extraction_result = self.extract_twitter_info(
-                        codigo_parlamentar=codigo_parlamentar,
-                        nome_completo=nome_completo,
-                        nome_parlamentar=nome_parlamentar,
-                        partido=partido,
-                        uf=uf
-                    )
+                    extraction_result = extraction_results[api_id]
                     
                     twitter_url = extraction_result.get('twitter_url')
                     metadata = extraction_result.get('metadata', {})
+                    twitter_fields = {
+                        'twitter_url': twitter_url,
+                        'social_media_source': metadata.get('source'),
+                        'social_media_confidence': metadata.get('confidence'),
+                        'needs_social_media_review': metadata.get('needs_review', False),
+                    }
+                    review_status = " [NEEDS SOCIAL MEDIA REVIEW]" if twitter_fields['needs_social_media_review'] else ""
                     
-                    # Get or create senator
-                    senator, created = Senador.objects.get_or_create(
-                        api_id=codigo_parlamentar,
-                        defaults={
-                            'nome_parlamentar': nome_parlamentar,
-                            'partido': partido,
-                            'uf': uf,
-                            'email': senator_data.get('email'),
-                            'telefone': telefone,
-                            'foto_url': senator_data.get('foto_url'),
-                            'twitter_url': twitter_url,
-                            'social_media_source': metadata.get('source'),
-                            'social_media_confidence': metadata.get('confidence'),
-                            'needs_social_media_review': metadata.get('needs_review', False),
-                            'is_active': True
-                        }
-                    )
-                    
-                    if created:
+                    if senator is None:
+                        senator = Senador(
+                            api_id=api_id,
+                            nome_parlamentar=nome_parlamentar,
+                            partido=partido,
+                            uf=uf,
+                            email=senator_data.get('email'),
+                            telefone=telefone,
+                            foto_url=senator_data.get('foto_url'),
+                            is_active=True,
+                            **twitter_fields
+                        )
+                        existing_senators[api_id] = senator
+                        new_senators.append(senator)
                         created_count += 1
-                        review_status = " [NEEDS SOCIAL MEDIA REVIEW]" if metadata.get('needs_review', False) else ""
-                        logger.info(f"✓ Created: {senator.nome_parlamentar}{review_status}")
-                    elif update_existing:
+                        logger.info("✓ Created: %s%s", senator.nome_parlamentar, review_status)
+                    else:
                         # Update existing senator
                         senator.nome_parlamentar = nome_parlamentar
                         senator.partido = partido
@@ -512,32 +554,31 @@ class SenadoresDataExtractor:
                             senator.foto_url = senator_data['foto_url']
                         
                         # Update Twitter info
-                        senator.twitter_url = twitter_url
-                        senator.social_media_source = metadata.get('source')
-                        senator.social_media_confidence = metadata.get('confidence')
-                        senator.needs_social_media_review = metadata.get('needs_review', False)
+                        for field, value in twitter_fields.items():
+                            setattr(senator, field, value)
                         
-                        senator.save()
+                        # bulk_update() does not apply auto_now
+                        senator.updated_at = now
+                        if senator.pk is not None:
+                            changed_senators[api_id] = senator
                         updated_count += 1
-                        review_status = " [NEEDS SOCIAL MEDIA REVIEW]" if metadata.get('needs_review', False) else ""
-                        logger.info(f"✓ Updated: {senator.nome_parlamentar}{review_status}")
-                    else:
-                        # Just mark as active
-                        senator.is_active = True
-                        senator.save()
-                    
-
-                    
-                    # Add delay to respect API rate limits
-                    if self.grok_service and i % 10 == 0:  # Every 10 requests
-                        logger.info("Rate limiting pause...")
-                        time.sleep(2)
+                        logger.info("✓ Updated: %s%s", senator.nome_parlamentar, review_status)
                         
                 except Exception as e:
                     senator_name = senator_data.get('nome_parlamentar', 'Unknown') if senator_data else 'Unknown'
-                    logger.error(f"✗ Error processing senator {senator_name}: {str(e)}")
+                    logger.error("✗ Error processing senator %s: %s", senator_name, e)
                     continue
+            
+            Senador.objects.bulk_create(new_senators, batch_size=BULK_BATCH_SIZE)
+            Senador.objects.bulk_update(
+                changed_senators.values(), SENATOR_UPDATE_FIELDS, batch_size=BULK_BATCH_SIZE
+            )
+            if reactivated_api_ids:
+                Senador.objects.filter(api_id__in=reactivated_api_ids).update(is_active=True, updated_at=now)
+        
+        # Bulk writes send no signals, so the admin's cached party choices are dropped here
+        clear_partido_choices(Senador)
         
-        logger.info(f"\nExtraction completed: {created_count} created, {updated_count} updated")
+        logger.info("\nExtraction completed: %s created, %s updated", created_count, updated_count)
         logger.info("New Grok-enhanced extraction flow completed successfully!")
         return created_count, updated_count
\ No newline at end of file
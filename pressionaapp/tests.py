@@ -1,3 +1,309 @@
-from django.test import TestCase
+import json
+from unittest import mock
 
-# Create your tests here.
+import requests
+from django.core.cache import caches
+from django.test import SimpleTestCase, TestCase, override_settings
+
+from .admin_cache import ADMIN_CACHE_ALIAS
+from .deputados_extractor import DeputadosDataExtractor
+from .grok_service import RateLimiter
+from .http_cache import HTTP_CACHE_ALIAS, cached_get
+from .models import Deputado, Senador
+from .senadores_extractor import SenadoresDataExtractor
+
+TEST_CACHES = {
+    'default': {'BACKEND': 'django.core.cache.backends.locmem.LocMemCache'},
+    HTTP_CACHE_ALIAS: {
+        'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+        'LOCATION': 'http-cache-tests',
+    },
+    ADMIN_CACHE_ALIAS: {
+        'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+        'LOCATION': 'admin-cache-tests',
+    },
+}
+
+
+def make_response(status_code, content=b'', headers=None):
+    response = requests.Response()
+    response.status_code = status_code
+    response.reason = 'Not Found' if status_code == 404 else 'OK'
+    response._content = content
+    response.headers.update(headers or {})
+    return response
+
+
+class FakeSession:
+    """Returns queued responses and records the headers of each request"""
+    
+    def __init__(self, *responses):
+        self.responses = list(responses)
+        self.requests = []
+    
+    def get(self, url, headers=None, timeout=None):
+        self.requests.append(headers or {})
+        response = self.responses.pop(0)
+        response.url = url
+        return response
+
+
+class RoutedSession:
+    """Answers each URL (without its query string) from a fixed table; anything else is a 404"""
+    
+    def __init__(self, routes):
+        self.routes = routes
+    
+    def get(self, url, headers=None, timeout=None):
+        response = self.routes.get(url.split('?')[0]) or make_response(404)
+        response.url = url
+        return response
+    
+    def close(self):
+        pass
+
+
+def json_response(data):
+    return make_response(200, json.dumps(data).encode())
+
+
+class FakeClock:
+    """Stands in for the time module; sleeping advances the monotonic clock"""
+    
+    def __init__(self):
+        self.now = 0.0
+        self.sleeps = []
+    
+    def monotonic(self):
+        return self.now
+    
+    def sleep(self, seconds):
+        self.sleeps.append(seconds)
+        self.now += seconds
+
+
+def senator_xml(codigo, nome, partido, uf):
+    return (
+        f'<Parlamentar><IdentificacaoParlamentar>'
+        f'<CodigoParlamentar>{codigo}</CodigoParlamentar><NomeParlamentar>{nome}</NomeParlamentar>'
+        f'<NomeCompletoParlamentar>Senador {nome}</NomeCompletoParlamentar>'
+        f'<SiglaPartidoParlamentar>{partido}</SiglaPartidoParlamentar><UfParlamentar>{uf}</UfParlamentar>'
+        f'<EmailParlamentar>sen.{codigo}@senado.leg.br</EmailParlamentar>'
+        f'</IdentificacaoParlamentar><Gabinete><Telefone>3303-000{codigo}</Telefone></Gabinete></Parlamentar>'
+    )
+
+
+@override_settings(CACHES=TEST_CACHES)
+class CachedGetTests(SimpleTestCase):
+    url = 'https://example.com/deputados/1'
+    
+    def setUp(self):
+        caches[HTTP_CACHE_ALIAS].clear()
+    
+    def test_not_modified_returns_cached_body(self):
+        session = FakeSession(
+            make_response(200, b'first', {'ETag': '"v1"'}),
+            make_response(304),
+        )
+        cached_get(session, self.url)
+        response = cached_get(session, self.url)
+        
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.content, b'first')
+        self.assertEqual(session.requests[1], {'If-None-Match': '"v1"'})
+    
+    def test_fresh_entry_skips_the_network(self):
+        session = FakeSession(make_response(200, b'page'))
+        cached_get(session, self.url, max_age=60)
+        response = cached_get(session, self.url, max_age=60)
+        
+        self.assertEqual(response.content, b'page')
+        self.assertEqual(len(session.requests), 1)
+    
+    def test_cached_not_found_still_raises(self):
+        session = FakeSession(make_response(404, headers={'ETag': '"gone"'}))
+        cached_get(session, self.url, max_age=60)
+        response = cached_get(session, self.url, max_age=60)
+        
+        self.assertEqual(len(session.requests), 1)
+        with self.assertRaises(requests.HTTPError):
+            response.raise_for_status()
+    
+    def test_response_without_validators_is_not_stored(self):
+        session = FakeSession(
+            make_response(200, b'first'),
+            make_response(200, b'second'),
+        )
+        cached_get(session, self.url)
+        response = cached_get(session, self.url)
+        
+        self.assertEqual(response.content, b'second')
+        self.assertEqual(session.requests, [{}, {}])
+
+
+@override_settings(CACHES=TEST_CACHES, GROK_API_KEY=None)
+class ExtractDeputiesTests(TestCase):
+    base_url = 'https://dadosabertos.camara.leg.br/api/v2'
+    
+    def setUp(self):
+        caches[HTTP_CACHE_ALIAS].clear()
+        self.kept = Deputado.objects.create(api_id=1, nome_parlamentar='Antigo Nome', partido='ABC', uf='SP')
+        self.changed = Deputado.objects.create(api_id=2, nome_parlamentar='Beltrano', partido='ABC', uf='RJ')
+        self.gone = Deputado.objects.create(api_id=3, nome_parlamentar='Ciclano', partido='XYZ', uf='MG')
+    
+    def deputy(self, api_id, nome, partido, uf):
+        return {'id': api_id, 'nome': nome, 'siglaPartido': partido, 'siglaUf': uf,
+                'email': f'dep{api_id}@camara.leg.br', 'urlFoto': f'https://www.camara.leg.br/{api_id}.jpg'}
+    
+    def details(self, api_id, twitter=None):
+        return json_response({'dados': {
+            'nomeCivil': f'Deputado {api_id}',
+            'redeSocial': [twitter] if twitter else [],
+            'ultimoStatus': {'gabinete': {'telefone': f'3215-000{api_id}'}},
+        }})
+    
+    def run_extraction(self, **kwargs):
+        with self.assertLogs('pressionaapp', level='INFO'):
+            extractor = DeputadosDataExtractor()
+            extractor.session = RoutedSession({
+                f'{self.base_url}/deputados': json_response({'dados': [
+                    self.deputy(1, 'Fulano', 'DEF', 'SP'),
+                    self.deputy(2, 'Beltrano', 'GHI', 'RJ'),
+                    self.deputy(4, 'Novo', 'ABC', 'BA'),
+                ], 'links': []}),
+                f'{self.base_url}/deputados/1': self.details(1, 'https://twitter.com/fulano'),
+                f'{self.base_url}/deputados/2': self.details(2),
+                f'{self.base_url}/deputados/4': self.details(4, 'https://x.com/novo'),
+            })
+            return extractor.extract_deputies(**kwargs)
+    
+    def test_creates_new_deputies(self):
+        self.assertEqual(self.run_extraction(), (1, 2))
+        
+        deputy = Deputado.objects.get(api_id=4)
+        self.assertEqual(deputy.nome_parlamentar, 'Novo')
+        self.assertEqual(deputy.telefone, '3215-0004')
+        self.assertEqual(deputy.social_media_source, 'official_api')
+        self.assertTrue(deputy.is_active)
+    
+    def test_updates_existing_deputies_with_one_timestamp(self):
+        self.run_extraction()
+        
+        kept = Deputado.objects.get(api_id=1)
+        changed = Deputado.objects.get(api_id=2)
+        self.assertEqual(kept.nome_parlamentar, 'Fulano')
+        self.assertEqual(kept.partido, 'DEF')
+        self.assertEqual(changed.partido, 'GHI')
+        self.assertEqual(changed.telefone, '3215-0002')
+        self.assertEqual(kept.updated_at, changed.updated_at)
+        self.assertGreater(kept.updated_at, self.kept.updated_at)
+    
+    def test_marks_missing_deputies_inactive(self):
+        self.run_extraction(update_existing=False)
+        
+        self.assertFalse(Deputado.objects.get(api_id=3).is_active)
+        self.assertEqual(
+            set(Deputado.objects.filter(is_active=True).values_list('api_id', flat=True)), {1, 2, 4}
+        )
+
+
+@override_settings(CACHES=TEST_CACHES, GROK_API_KEY=None)
+class ExtractSenatorsTests(TestCase):
+    base_url = 'https://legis.senado.leg.br/dadosabertos'
+    
+    def setUp(self):
+        caches[HTTP_CACHE_ALIAS].clear()
+        self.kept = Senador.objects.create(api_id=1, nome_parlamentar='Antigo Nome', partido='ABC', uf='SP')
+        self.changed = Senador.objects.create(api_id=2, nome_parlamentar='Beltrano', partido='ABC', uf='RJ')
+        self.gone = Senador.objects.create(api_id=3, nome_parlamentar='Ciclano', partido='XYZ', uf='MG')
+    
+    def run_extraction(self, **kwargs):
+        senators = [('1', 'Fulano', 'DEF', 'SP'), ('2', 'Beltrano', 'GHI', 'RJ'), ('4', 'Novo', 'ABC', 'BA')]
+        routes = {
+            f'{self.base_url}/senador/lista/atual': make_response(200, (
+                '<ListaParlamentarEmExercicio><Parlamentares>'
+                + ''.join(senator_xml(*senator) for senator in senators)
+                + '</Parlamentares></ListaParlamentarEmExercicio>'
+            ).encode()),
+            'https://www25.senado.leg.br/web/senadores/senador/-/perfil/4': make_response(
+                200, b'<html><body><a href="https://x.com/senadornovo">X</a></body></html>'
+            ),
+        }
+        for senator in senators:
+            routes[f'{self.base_url}/senador/{senator[0]}'] = make_response(
+                200, f'<DetalheParlamentar>{senator_xml(*senator)}</DetalheParlamentar>'.encode()
+            )
+        
+        with self.assertLogs('pressionaapp', level='INFO'):
+            extractor = SenadoresDataExtractor()
+            extractor.session = RoutedSession(routes)
+            return extractor.extract_senators(**kwargs)
+    
+    def test_creates_new_senators(self):
+        self.assertEqual(self.run_extraction(), (1, 2))
+        
+        senator = Senador.objects.get(api_id=4)
+        self.assertEqual(senator.nome_parlamentar, 'Novo')
+        self.assertEqual(senator.telefone, '3303-0004')
+        self.assertEqual(senator.twitter_url, 'https://x.com/senadornovo')
+        self.assertTrue(senator.is_active)
+    
+    def test_updates_existing_senators_with_one_timestamp(self):
+        self.run_extraction()
+        
+        kept = Senador.objects.get(api_id=1)
+        changed = Senador.objects.get(api_id=2)
+        self.assertEqual(kept.nome_parlamentar, 'Fulano')
+        self.assertEqual(kept.partido, 'DEF')
+        self.assertEqual(changed.partido, 'GHI')
+        self.assertEqual(changed.telefone, '3303-0002')
+        self.assertEqual(kept.updated_at, changed.updated_at)
+        self.assertGreater(kept.updated_at, self.kept.updated_at)
+    
+    def test_marks_missing_senators_inactive(self):
+        self.run_extraction(update_existing=False)
+        
+        self.assertFalse(Senador.objects.get(api_id=3).is_active)
+        self.assertEqual(
+            set(Senador.objects.filter(is_active=True).values_list('api_id', flat=True)), {1, 2, 4}
+        )
+
+
+class RateLimiterTests(SimpleTestCase):
+    def setUp(self):
+        self.clock = FakeClock()
+        patcher = mock.patch('pressionaapp.grok_service.time', self.clock)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.limiter = RateLimiter(rate=2, capacity=3)
+    
+    def test_burst_does_not_block(self):
+        for _ in range(3):
+            self.limiter.acquire()
+        
+        self.assertEqual(self.clock.sleeps, [])
+    
+    def test_blocks_when_empty(self):
+        for _ in range(4):
+            self.limiter.acquire()
+        
+        self.assertEqual(self.clock.sleeps, [0.5])
+    
+    def test_refills_at_rate(self):
+        for _ in range(3):
+            self.limiter.acquire()
+        self.clock.now += 1
+        
+        self.limiter.acquire()
+        self.limiter.acquire()
+        self.assertEqual(self.clock.sleeps, [])
+        
+        self.limiter.acquire()
+        self.assertEqual(self.clock.sleeps, [0.5])
+    
+    def test_refill_is_capped_at_capacity(self):
+        self.clock.now += 60
+        for _ in range(4):
+            self.limiter.acquire()
+        
+        self.assertEqual(self.clock.sleeps, [0.5])
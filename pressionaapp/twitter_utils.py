@@ -0,0 +1,27 @@
+"""
+Twitter/X URL helpers shared by the extractors, models, admin and tweet collectors
+"""
+import re
+
+# Twitter/X profile URL with optional protocol, www and @; captures the username
+TWITTER_URL_RE = re.compile(r'(?:https?://)?(?:www\.)?(?:twitter\.com|x\.com)/(?:@)?(\w+)(?:\?.*)?(?:#.*)?')
+
+# Numeric tweet ID in a status URL
+TWEET_ID_RE = re.compile(r'/status/(\d+)')
+
+
+def clean_twitter_url(url: str) -> str:
+    """Clean Twitter URL to standardized format without @ or www"""
+    if not url:
+        return url
+
+    # Remove protocol, www, and extract clean username
+    match = TWITTER_URL_RE.match(url.strip())
+
+    if match:
+        username = match.group(1)
+        # Return clean X.com URL format
+        return f"https://x.com/{username}"
+
+    # If pattern doesn't match, return original URL
+    return url.strip()